@@ -0,0 +1,137 @@
+"""
+Element lookup cache for Selenium.
+
+The DataLumos workspace form is driven by the same handful of selectors over and over
+(the keyword box, the save buttons of the edit forms, ...). Each lookup through
+WebDriverWait costs at least one WebDriver HTTP round-trip, so this module remembers the
+elements it has found and hands them back while they are still attached to the page.
+"""
+
+from selenium.common.exceptions import (ElementClickInterceptedException, ElementNotInteractableException,
+                                        StaleElementReferenceException)
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class CachedFinder:
+    """
+    Find elements through WebDriverWait, reusing previously found elements while they are valid.
+
+    Cached elements are checked with a cheap is_enabled() call before being returned; if the
+    page has re-rendered them (StaleElementReferenceException) they are looked up again.
+    Call invalidate() after anything that navigates to a new page.
+
+    Example:
+        finder = CachedFinder(mydriver)
+        keywords_form = finder.find((By.CSS_SELECTOR, ".select2-search__field"), timeout=50)
+        ...
+        project_title_apply2.click()   # navigates to the project workspace
+        finder.invalidate()
+    """
+
+    def __init__(self, driver, poll_frequency=0.5):
+        """
+        Args:
+            driver: Selenium WebDriver object
+            poll_frequency: Seconds between checks of a wait condition, for every wait
+                created by this finder (default: 0.5, as WebDriverWait)
+        """
+        self.driver = driver
+        self.poll_frequency = poll_frequency
+        self._cache = {}
+        self._waits = {}
+
+    def wait(self, timeout, poll_frequency=None):
+        """
+        Return a WebDriverWait for the given timeout, creating it only once.
+
+        Args:
+            timeout: Timeout in seconds
+            poll_frequency: Seconds between checks (default: the finder's poll_frequency)
+
+        Returns:
+            WebDriverWait instance bound to this finder's driver
+        """
+        key = (timeout, poll_frequency or self.poll_frequency)
+        if key not in self._waits:
+            self._waits[key] = WebDriverWait(self.driver, timeout, poll_frequency=key[1])
+        return self._waits[key]
+
+    def find(self, locator, timeout=10, condition=EC.presence_of_element_located):
+        """
+        Return the element for a locator, from the cache if it is still attached to the page.
+
+        Args:
+            locator: (By, selector) tuple
+            timeout: Seconds to wait if the element has to be looked up
+            condition: Expected condition factory used for the lookup
+                (default: EC.presence_of_element_located)
+
+        Returns:
+            WebElement
+
+        Raises:
+            TimeoutException: If the element is not found within the timeout
+        """
+        element = self._cache.get(locator)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except StaleElementReferenceException:
+                del self._cache[locator]
+        element = self.wait(timeout).until(condition(locator))
+        self._cache[locator] = element
+        return element
+
+    def click(self, locator, timeout=10):
+        """
+        Click the element for a locator, trying a cached element first.
+
+        A cached element is clicked directly if it is still displayed, without waiting for it to
+        be clickable. If it has been re-rendered, hidden or removed in the meantime (e.g. the
+        submit button of an inline-edit form that has closed, while the locator now matches the
+        button of another form), or another element such as an overlay receives the click, the
+        element is looked up again (waiting until it is clickable) and clicked, retrying while
+        the click is intercepted.
+
+        Args:
+            locator: (By, selector) tuple
+            timeout: Seconds to wait if the element has to be looked up
+
+        Raises:
+            TimeoutException: If no clickable element is found, or the click is still
+                intercepted, within the timeout
+        """
+        element = self._cache.pop(locator, None)
+        if element is not None:
+            try:
+                if element.is_displayed():
+                    element.click()
+                    self._cache[locator] = element
+                    return
+            except (StaleElementReferenceException, ElementNotInteractableException, ElementClickInterceptedException):
+                pass
+        element = self.wait(timeout).until(EC.element_to_be_clickable(locator))
+
+        def clicked(driver):
+            try:
+                element.click()
+                return True
+            except ElementClickInterceptedException:
+                return False
+
+        self.wait(timeout).until(clicked)
+        self._cache[locator] = element
+
+    def invalidate(self, locator=None):
+        """
+        Forget cached elements.
+
+        Args:
+            locator: Only forget this locator (default: forget everything)
+        """
+        if locator is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(locator, None)
@@ -13,11 +13,13 @@ There is no error handling. But the browser remains open even if the script cras
 
 
 import math
+import random
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (ElementClickInterceptedException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException, WebDriverException)
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -25,14 +27,23 @@ from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.common.keys import Keys
-from time import sleep
+from time import sleep, monotonic
 import csv
+import html
+import requests
 import traceback
 import os
 import re
 import argparse
-import pandas as pd
+import sys
+import threading
+import queue
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from cached_finder import CachedFinder
+from row_data import RowData
+from workspace_id_csv import WorkspaceIdCsv
 
 # Google Sheets API imports (optional - only used if Google Sheets is configured)
 try:
@@ -43,6 +54,13 @@ try:
 except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
 
+# File locking for the CSV writability check: msvcrt on Windows, fcntl elsewhere
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+    import fcntl
+
 
 #########################################################
 # Command line arguments are now used instead of hardcoded variables
@@ -51,6 +69,76 @@ except ImportError:
 
 url_datalumos = "https://www.datalumos.org/datalumos/workspace"
 
+# Seconds a page may take to load before get() gives up (the DataLumos workspace can be slow)
+PAGE_LOAD_TIMEOUT = 120
+
+# Seconds between checks of a wait condition in the form-filling flow
+POLL_FREQUENCY = 0.1
+
+# Seconds between the starts of parallel workers, so their browsers don't all sign in at once
+WORKER_START_STAGGER = 5
+
+# Workspace ID in a DataLumos project URL, e.g. .../datalumos/239181
+WORKSPACE_ID_RE = re.compile(r'/datalumos/(\d+)')
+
+# Path separator used by the other operating system; project folder paths from the CSV are normalized to os.sep
+FOREIGN_PATH_SEP = "/" if os.sep == "\\" else "\\"
+
+# Any button-like element whose text contains "login", matched case-insensitively
+LOC_LOGIN_BUTTON = (By.XPATH, "//*[self::button or self::a or @role='button']"
+                              "[contains(translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'login')]")
+# Locators for the sign-in pages
+LOC_EMAIL_LOGIN = (By.ID, "kc-emaillogin")
+LOC_USERNAME = (By.CSS_SELECTOR, "input#username, input[name='username']")
+LOC_PASSWORD = (By.CSS_SELECTOR, "input#password, input[name='password']")
+LOC_SIGN_IN_SUBMIT = (By.CSS_SELECTOR, "input[type='submit'][value='Sign In'], input.pf-c-button.btn.btn-primary[type='submit']")
+
+# Locators for the DataLumos project workspace, defined once instead of being rebuilt for every row
+LOC_NEW_PROJECT_BTN = (By.CSS_SELECTOR, ".btn > span:nth-child(3)")
+LOC_TITLE = (By.ID, "title")
+LOC_SAVE_PROJECT = (By.CSS_SELECTOR, ".save-project")
+LOC_CONTINUE_TO_WORKSPACE = (By.LINK_TEXT, "Continue To Project Workspace")
+LOC_EXPAND_TOGGLE = (By.CSS_SELECTOR, "#expand-init > span:nth-child(2)")
+LOC_AGENCY_ADD_VALUE = (By.CSS_SELECTOR, "#groupAttr0 > div:nth-child(1) > div:nth-child(1) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)")
+LOC_AGENCY_TAB = (By.LINK_TEXT, "Organization/Agency")
+LOC_ORG_NAME = (By.ID, "orgName")
+# Suggestions of the jQuery UI autocomplete below the organization name; they are given at most
+#   AUTOCOMPLETE_APPEAR_TIMEOUT seconds to show up (there are none if nothing matches) and
+#   AUTOCOMPLETE_CLOSE_TIMEOUT seconds to close after being dismissed
+LOC_AUTOCOMPLETE_ITEM = (By.CSS_SELECTOR, ".ui-autocomplete .ui-menu-item")
+AUTOCOMPLETE_APPEAR_TIMEOUT = 0.5
+AUTOCOMPLETE_CLOSE_TIMEOUT = 5
+LOC_SAVE_ORG = (By.CSS_SELECTOR, ".save-org")
+LOC_SUMMARY_EDIT = (By.CSS_SELECTOR, "#edit-dcterms_description_0 > span:nth-child(2)")
+LOC_WYSIWYG_IFRAME = (By.CSS_SELECTOR, "iframe.wysihtml5-sandbox")
+LOC_SAVE_CHECKMARK = (By.CSS_SELECTOR, ".glyphicon-ok")
+LOC_SOURCE_URL_EDIT = (By.CSS_SELECTOR, "#edit-imeta_sourceURL_0 > span:nth-child(1) > span:nth-child(2)")
+LOC_EDITABLE_INPUT = (By.CSS_SELECTOR, ".editable-input > input:nth-child(1)")
+LOC_KEYWORDS = (By.CSS_SELECTOR, ".select2-search__field")
+LOC_GEOGRAPHIC_EDIT = (By.CSS_SELECTOR, "#edit-dcterms_location_0 > span:nth-child(1) > span:nth-child(2)")
+LOC_TIME_PERIOD_ADD = (By.CSS_SELECTOR, "#groupAttr1 > div:nth-child(1) > div:nth-child(3) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)")
+LOC_START_DATE = (By.ID, "startDate")
+LOC_END_DATE = (By.ID, "endDate")
+LOC_SAVE_DATES = (By.CSS_SELECTOR, ".save-dates")
+LOC_DATATYPES_EDIT = (By.CSS_SELECTOR, "#disco_kindOfData_0 > span:nth-child(2)")
+LOC_EDITABLE_SUBMIT = (By.CSS_SELECTOR, ".editable-submit")
+LOC_COLLECTION_NOTES_EDIT = (By.CSS_SELECTOR, "#edit-imeta_collectionNotes_0 > span:nth-child(2)")
+LOC_UPLOAD_BTN = (By.PARTIAL_LINK_TEXT, "Upload Files")
+LOC_FILE_DROP_AREA = (By.CSS_SELECTOR, ".col-md-offset-2 > span:nth-child(1)")
+LOC_CLOSE_UPLOAD = (By.CSS_SELECTOR, ".importFileModal > div:nth-child(3) > button:nth-child(1)")
+
+# Locators for the publishing workflow; its buttons are the enabled primary buttons with a given text
+#   (see wait_for_button())
+PUBLISH_BUTTON_SELECTOR = "button.btn-primary:not([disabled])"
+LOC_NO_DISCLOSURE = (By.ID, "noDisclosure")
+LOC_SENSITIVE_NO = (By.ID, "sensitiveNo")
+LOC_DEPOSIT_AGREE = (By.ID, "depositAgree")
+LOC_ERROR_MSG = (By.ID, "errormsg")
+
+# The GWDA nomination form (posted directly, without the browser) and the timeout of its requests
+GWDA_NOMINATION_URL = "https://digital2.library.unt.edu/nomination/GWDA-US-2025/add/"
+GWDA_TIMEOUT = 30
+
 
 class BatchRestartException(Exception):
     """Exception raised when a batch needs to be restarted due to an error."""
@@ -60,6 +148,45 @@ class BatchRestartException(Exception):
         super().__init__(self.error_message)
 
 
+class SheetColumnsMissingError(ValueError):
+    """Exception raised when the Google Sheet lacks required columns; stops the whole run."""
+
+
+class RowSkippedError(Exception):
+    """Exception raised when a row can't be uploaded; the row is skipped before anything is done in the browser."""
+
+
+# A --rows value: comma-delimited row numbers and ranges, e.g. "1,3,5,7-10"
+ROW_LIST_RE = re.compile(r'\s*\d+\s*(?:-\s*\d+\s*)?(?:,\s*\d+\s*(?:-\s*\d+\s*)?)*')
+# One entry of a --rows value: a row number, or a range with start and end
+ROW_ENTRY_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+def parse_row_list(text):
+    """
+    Parse a comma-delimited list of row numbers and ranges.
+    
+    Args:
+        text: Row list, e.g. "1,3,5,7-10"
+    
+    Returns:
+        Sorted list of distinct row numbers
+    
+    Raises:
+        ValueError: If the text is not a list of numbers and ranges
+    
+    Example:
+        parse_row_list("7-10, 3,1,3")
+        # -> [1, 3, 7, 8, 9, 10]
+    """
+    if not ROW_LIST_RE.fullmatch(text):
+        raise ValueError(f"invalid row list '{text}'")
+    rows = set()
+    for match in ROW_ENTRY_RE.finditer(text):
+        start = int(match[1])
+        rows.update(range(start, int(match[2] or start) + 1))
+    return sorted(rows)
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -78,6 +205,15 @@ Examples:
   
   # Using Firefox instead of Chrome:
   python chiara_upload.py --csv "data.csv" --start-row 1 --end-row 5 --browser firefox --username "user@example.com" --password "pass123"
+  
+  # Keep the login in a browser profile, so later runs skip the sign-in:
+  python chiara_upload.py --csv "data.csv" --start-row 1 --end-row 5 --profile-dir "C:\\DataRescue\\browser-profile" --username "user@example.com" --password "pass123"
+  
+  # Three browsers working on the rows in parallel:
+  python chiara_upload.py --csv "data.csv" --start-row 1 --end-row 30 --workers 3 --username "user@example.com" --password "pass123" --folder "C:\\data"
+  
+  # Unattended run (e.g. from Task Scheduler), never waiting for keyboard input:
+  python chiara_upload.py --csv "data.csv" --start-row 1 --end-row 30 --no-interactive --username "user@example.com" --password "pass123" --folder "C:\\data"
         """
     )
     
@@ -105,9 +241,30 @@ Examples:
     parser.add_argument('--browser', choices=['chrome', 'chromium', 'firefox'], default='chrome',
                         help='Browser to use: chrome/chromium or firefox (default: chrome)')
     
+    parser.add_argument('--driver-path', default=None,
+                        help='Path of the chromedriver/geckodriver executable to use instead of looking it up with webdriver-manager (no network access needed)')
+    
+    parser.add_argument('--headless', action='store_true',
+                        help='Run the browser without a visible window and without loading images (requires --username and --password)')
+    
+    parser.add_argument('--page-load-strategy', choices=['normal', 'eager'], default='normal',
+                        help='When page loads return: normal (after images and scripts have loaded) or eager (as soon as the DOM is ready) (default: normal)')
+    
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose logging (default: one line per asset with summary)')
     
+    parser.add_argument('--profile-dir', default=None,
+                        help='Browser profile directory to keep the DataLumos login between runs; sign-in is skipped while the session is still valid (default: fresh profile every time)')
+    
+    parser.add_argument('--no-interactive', action='store_true',
+                        help='Never wait for keyboard input (manual login, locked CSV file); implied when input is not a terminal')
+    
+    parser.add_argument('--batch-size', type=int, default=5,
+                        help='Number of rows taken from the queue at a time; the Google Sheet is updated after each batch (default: 5)')
+    
+    parser.add_argument('--workers', '--parallel', dest='workers', type=int, default=1,
+                        help='Number of browsers processing rows in parallel, each with its own login; more than 1 requires --no-interactive (default: 1)')
+    
     parser.add_argument('--publish-mode', choices=['default', 'no-publish', 'only-publish'], default='default',
                         help='Publishing mode: default (run all steps including publish), no-publish (skip publishing), only-publish (only publish, skip form-filling)')
     
@@ -144,25 +301,25 @@ Examples:
     if args.end_row is not None and args.start_row is None:
         parser.error('--end-row requires --start-row to be specified')
     
+    if args.headless and not (args.username and args.password):
+        parser.error('--headless requires --username and --password (there is no window for a manual login)')
+    
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+    
+    # Prompts would block forever when run from a scheduler or with redirected input
+    args.interactive = not args.no_interactive and sys.stdin is not None and sys.stdin.isatty()
+    if args.workers > 1 and args.interactive:
+        # the prompts of parallel workers would interleave, and Enter could answer the wrong one
+        parser.error('--workers above 1 requires --no-interactive')
+    
     # Parse --rows if provided
     if args.rows:
         try:
-            # Parse comma-delimited list and handle ranges (e.g., "1,3,5,7-10")
-            rows_list = []
-            for part in args.rows.split(','):
-                part = part.strip()
-                if '-' in part:
-                    # Handle range (e.g., "7-10")
-                    start, end = part.split('-', 1)
-                    start = int(start.strip())
-                    end = int(end.strip())
-                    rows_list.extend(range(start, end + 1))
-                else:
-                    # Single number
-                    rows_list.append(int(part))
-            # Remove duplicates and sort
-            args.rows = sorted(list(set(rows_list)))
-            if not args.rows or any(row < 1 for row in args.rows):
+            args.rows = parse_row_list(args.rows)
+            if not args.rows or args.rows[0] < 1:
                 parser.error('--rows must contain only positive integers (row numbers start at 1)')
         except ValueError as e:
             parser.error(f'--rows must be a comma-delimited list of integers and optional ranges (e.g., "1,3,5,7-10"): {e}')
@@ -172,40 +329,93 @@ Examples:
     return args
 
 
-def initialize_browser(browser_choice='chrome'):
+# Serializes the driver lookup, so parallel workers don't download the same driver at the same time
+driver_path_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _find_driver_path(browser_choice):
+    if browser_choice == 'firefox':
+        return GeckoDriverManager().install()
+    return ChromeDriverManager().install()
+
+def get_driver_path(browser_choice):
+    """
+    Return the path of the WebDriver executable for a browser, looking it up only once per run.
+    
+    webdriver-manager checks for a matching driver version (and downloads it if needed) on
+    every install() call; the result is kept for every later batch and worker.
+    
+    Args:
+        browser_choice: 'chrome', 'chromium', or 'firefox'
+    
+    Returns:
+        Path of the chromedriver or geckodriver executable
+    """
+    with driver_path_lock:
+        return _find_driver_path('firefox' if browser_choice.lower() == 'firefox' else 'chrome')
+
+
+def initialize_browser(browser_choice='chrome', profile_dir=None, page_load_strategy='normal', headless=False, driver_path=None):
     """
     Initialize the appropriate browser driver.
     
     Args:
         browser_choice: 'chrome', 'chromium', or 'firefox'
+        profile_dir: Optional browser profile directory. Cookies (and so the DataLumos login)
+            are kept there between runs. Created if it doesn't exist.
+        page_load_strategy: 'normal' or 'eager'. With 'eager', get() and clicks that navigate
+            return once the DOM is ready instead of waiting for every image and script;
+            the form code waits for the elements it needs anyway.
+        headless: Run without a visible browser window and without loading images
+        driver_path: Path of the chromedriver/geckodriver executable (default: found and,
+            if needed, downloaded by webdriver-manager)
     
     Returns:
         WebDriver instance
     """
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
     if browser_choice.lower() in ['chrome', 'chromium']:
         # Set up Chrome options
         chrome_options = ChromeOptions()
-        # Uncomment the line below to run in headless mode (no visible browser window)
-        # chrome_options.add_argument("--headless")
+        if headless:
+            # No visible browser window; images are only decoration for the form automation
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1920,1080")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Initialize Chrome driver using webdriver-manager to automatically handle ChromeDriver
-        service = ChromeService(ChromeDriverManager().install())
+        # extensions only cost start-up time for an automated session
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.page_load_strategy = page_load_strategy
+        if profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+        
+        # Initialize Chrome driver; webdriver-manager finds ChromeDriver unless --driver-path is given
+        service = ChromeService(driver_path or get_driver_path(browser_choice))
         driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         print(f"✓ Initialized Chrome browser")
         return driver
     
     elif browser_choice.lower() == 'firefox':
         # Set up Firefox options
         firefox_options = FirefoxOptions()
-        # Uncomment the line below to run in headless mode
-        # firefox_options.add_argument("--headless")
-        
-        # Initialize Firefox driver using webdriver-manager to automatically handle GeckoDriver
-        service = FirefoxService(GeckoDriverManager().install())
+        if headless:
+            firefox_options.add_argument("--headless")
+            # 2 = block all images
+            firefox_options.set_preference("permissions.default.image", 2)
+        firefox_options.page_load_strategy = page_load_strategy
+        if profile_dir:
+            firefox_options.add_argument("-profile")
+            firefox_options.add_argument(os.path.abspath(profile_dir))
+        
+        # Initialize Firefox driver; webdriver-manager finds GeckoDriver unless --driver-path is given
+        service = FirefoxService(driver_path or get_driver_path(browser_choice))
         driver = webdriver.Firefox(service=service, options=firefox_options)
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         print(f"✓ Initialized Firefox browser")
         return driver
     
@@ -213,6 +423,12 @@ def initialize_browser(browser_choice='chrome'):
         raise ValueError(f"Unsupported browser choice: {browser_choice}. Use 'chrome' or 'firefox'.")
 
 
+# Returns true while a "Verifying you are human" challenge is shown (by text, or by a class/id containing "verifying")
+JS_VERIFICATION_PRESENT = """
+    if (document.querySelector("[class*='verifying'], [id*='verifying']")) return true;
+    return !!document.body && /verifying[^\\n]*human/i.test(document.body.innerText);
+"""
+
 def wait_for_verification(driver, timeout=30):
     """
     Wait for "Verifying you are human" message to complete.
@@ -225,39 +441,73 @@ def wait_for_verification(driver, timeout=30):
         bool: True if verification completed, False if timeout
     """
     try:
-        # Check for various forms of verification message
-        verification_selectors = [
-            (By.XPATH, "//*[contains(text(), 'Verifying you are human')]"),
-            (By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'verifying') and contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'human')]"),
-            (By.CSS_SELECTOR, "[class*='verifying']"),
-            (By.CSS_SELECTOR, "[id*='verifying']")
-        ]
-        
-        verification_found = False
-        for selector_type, selector in verification_selectors:
-            try:
-                elements = driver.find_elements(selector_type, selector)
-                if len(elements) > 0:
-                    verification_found = True
-                    print("Human verification detected, waiting for completion...")
-                    # Wait for the verification message to disappear
-                    WebDriverWait(driver, timeout).until(EC.invisibility_of_element_located((selector_type, selector)))
-                    print("✓ Verification completed")
-                    break
-            except Exception:
-                continue
-        
-        # Additional wait for page to be ready after verification
-        sleep(2)
+        wait = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY)
+        # Check all forms of the verification message in one script call; nothing to wait for in the common case
+        if driver.execute_script(JS_VERIFICATION_PRESENT):
+            print("Human verification detected, waiting for completion...")
+            # Wait for the verification message to disappear
+            wait.until(lambda d: not d.execute_script(JS_VERIFICATION_PRESENT))
+            print("✓ Verification completed")
+        
+        # Wait for the page to finish loading after verification
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
         return True
     except Exception as e:
         # If we can't find the verification message or it times out, continue anyway
         print(f"Note: Verification check completed (or not needed)")
-        sleep(2)
         return True
 
 
-def sign_in(driver, username=None, password=None):
+def navigate(driver, url, page_fresh=False):
+    """
+    Open a URL, unless the page was freshly loaded and the browser shows exactly that page.
+    
+    A page left behind by an earlier row may be in any state (e.g. an open modal after a
+    failure), so it is only reused when the caller knows it was just loaded.
+    
+    Args:
+        driver: Selenium WebDriver object
+        url: URL to open
+        page_fresh: True if the current page was just loaded (e.g. by the sign-in) and
+            nothing has been done on it since (default: False, always load the URL)
+    
+    Returns:
+        bool: True if the page was loaded, False if it was already shown
+    """
+    if page_fresh and driver.current_url == url:
+        return False
+    driver.get(url)
+    return True
+
+
+def is_signed_in(driver, timeout=10):
+    """
+    Check whether the browser already has a valid DataLumos session (e.g. from a saved profile).
+    
+    Opens the workspace; without a session DataLumos redirects to the login page. If there is
+    no redirect, the "New Project" button confirms that the workspace of a logged-in user is shown.
+    
+    Args:
+        driver: Selenium WebDriver object
+        timeout: Seconds to wait for the "New Project" button (default: 10)
+    
+    Returns:
+        bool: True if the workspace opened without a login redirect and shows the "New Project" button
+    """
+    try:
+        driver.get(url_datalumos)
+        wait_for_verification(driver)
+        current_url = driver.current_url
+        if not current_url.startswith(url_datalumos) or 'login' in current_url.lower():
+            return False
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            EC.presence_of_element_located(LOC_NEW_PROJECT_BTN))
+        return True
+    except Exception:
+        return False
+
+
+def sign_in(driver, username=None, password=None, interactive=True):
     """
     Automate the sign-in process for DataLumos.
     
@@ -265,6 +515,7 @@ def sign_in(driver, username=None, password=None):
         driver: Selenium WebDriver object
         username: Optional username/email for automated login
         password: Optional password for automated login
+        interactive: Whether the user can be asked to log in manually (default: True)
     
     Returns:
         Tuple of (success: bool, message: str)
@@ -277,24 +528,14 @@ def sign_in(driver, username=None, password=None):
         
         # Click Login button
         print("Looking for 'Login' button...")
-        login_found = False
         
-        # Try to find Login button by text
-        all_buttons = driver.find_elements(By.CSS_SELECTOR, "button, a, [role='button']")
-        
-        for button in all_buttons:
-            try:
-                text = button.text.strip()
-                if text.lower() == 'login' or 'login' in text.lower():
-                    print(f"Found Login button: '{text}'")
-                    button.click()
-                    login_found = True
-                    break
-            except Exception:
-                continue
+        # Let the browser filter by (case-insensitive) text instead of reading .text on every button
+        login_buttons = driver.find_elements(*LOC_LOGIN_BUTTON)
         
-        if not login_found:
+        if not login_buttons:
             return False, "Could not find Login button"
+        print(f"Found Login button: '{login_buttons[0].text.strip()}'")
+        login_buttons[0].click()
         
         # Wait for login page to load and any verification
         wait_for_verification(driver)
@@ -303,7 +544,7 @@ def sign_in(driver, username=None, password=None):
         print("Looking for 'Sign in with Email' button...")
 
         
-        email_button = driver.find_element(By.ID, 'kc-emaillogin')
+        email_button = driver.find_element(*LOC_EMAIL_LOGIN)
         
         if not email_button:
             return False, "Could not find 'Sign in with Email' button"
@@ -317,7 +558,7 @@ def sign_in(driver, username=None, password=None):
             # Fill in username/email
             print("Filling in username/email address...")
             try:
-                username_input = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "input#username, input[name='username']")))
+                username_input = WebDriverWait(driver, 10).until(EC.presence_of_element_located(LOC_USERNAME))
                 username_input.clear()
                 username_input.send_keys(username)
                 print("✓ Username field filled")
@@ -327,19 +568,17 @@ def sign_in(driver, username=None, password=None):
             # Fill in password
             print("Filling in password...")
             try:
-                password_input = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "input#password, input[name='password']")))
+                password_input = WebDriverWait(driver, 10).until(EC.presence_of_element_located(LOC_PASSWORD))
                 password_input.clear()
                 password_input.send_keys(password)
                 print("✓ Password field filled")
             except Exception:
                 return False, "Could not find password input field"
             
-            sleep(0.5)
-            
             # Submit the form by clicking the Sign In button
             print("Clicking Sign In button...")
             try:
-                submit_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][value='Sign In'], input.pf-c-button.btn.btn-primary[type='submit']")))
+                submit_button = WebDriverWait(driver, 10).until(EC.element_to_be_clickable(LOC_SIGN_IN_SUBMIT))
                 submit_button.click()
                 print("✓ Sign In button clicked")
             except Exception:
@@ -347,9 +586,15 @@ def sign_in(driver, username=None, password=None):
                 print("Sign In button not found, trying Enter key...")
                 password_input.send_keys(Keys.RETURN)
             
-            # Wait for sign-in to complete
+            # Wait for sign-in to complete: the login form is replaced once the redirect happens
             print("Waiting for sign-in to complete...")
-            sleep(3)
+            try:
+                WebDriverWait(driver, 15).until(EC.staleness_of(password_input))
+                WebDriverWait(driver, 15).until(lambda d: d.execute_script("return document.readyState") == "complete")
+            except TimeoutException:
+                print("⚠ Sign-in redirect not detected yet, continuing anyway")
+        elif not interactive:
+            return False, "Username and password not provided, and manual login is not possible when running non-interactively"
         else:
             # No credentials provided - pause for manual login
             print("\n" + "=" * 80)
@@ -368,25 +613,195 @@ def sign_in(driver, username=None, password=None):
         return False, error_msg
 
 
+# Returns true once the upload dialog shows at least args[0] "File added to queue for upload." messages (one per uploaded file)
+JS_UPLOADED_FILES_COMPLETE = """
+    return Array.from(document.querySelectorAll('span'))
+        .filter(span => span.textContent === 'File added to queue for upload.').length >= args[0];
+"""
+
+# Returns the first element to click to close the organization autocomplete dropdown:
+#   the orgName label, a label mentioning Organization/Agency, or the modal header/title (null if none)
+JS_FIND_DROPDOWN_DISMISS_TARGET = """
+    const label = document.querySelector("label[for='orgName']");
+    if (label) return label;
+    const textLabel = Array.from(document.querySelectorAll('label')).find(
+        l => l.textContent.includes('Organization') || l.textContent.includes('Agency'));
+    if (textLabel) return textLabel;
+    return document.querySelector('.modal-header, .modal-title');
+"""
+
+# Returns true while the "busy" overlay is in the page and rendered
+JS_BUSY_OVERLAY_VISIBLE = "const el = document.getElementById('busy'); return !!el && el.getClientRects().length > 0;"
+
+# Returns true once the "busy" overlay is hidden or removed
+JS_BUSY_OVERLAY_GONE = "const el = document.getElementById('busy'); return !(el && el.getClientRects().length > 0);"
+
+# Longest time to wait for the "busy" overlay
+BUSY_OVERLAY_TIMEOUT = 360
+
 def wait_for_obscuring_elements(current_driver_obj, verbose):
-    overlays = current_driver_obj.find_elements(By.ID, "busy")  # caution: find_elements, not find_element
-    if len(overlays) != 0:  # there is an overlay
-        # verbose_print(f"... (Waiting for overlay to disappear. Overlay(s): {overlays})", verbose)
-        for overlay in overlays:
-            # Wait until the overlay becomes invisible:
-            WebDriverWait(current_driver_obj, 360).until(EC.invisibility_of_element_located(overlay))
-            sleep(0.5)
-
-def read_csv_line(csv_file, line_to_process):
-    # gets the input from the specified line of the csv file, to put it in the datalumos forms.
-    # CSV files are expected to be UTF-8-sig encoded
+    """
+    Wait until the DataLumos "busy" overlay is gone.
+    
+    The check is a single script call, so the common case (no overlay) costs one round-trip.
+    While the overlay is shown, a MutationObserver in the page reports its removal as soon
+    as it happens, instead of the overlay being polled.
+    
+    Args:
+        current_driver_obj: WebDriver instance
+        verbose: Whether verbose logging is enabled
+    
+    Raises:
+        TimeoutException: If the overlay is still shown after BUSY_OVERLAY_TIMEOUT seconds
+    """
+    if not current_driver_obj.execute_script(JS_BUSY_OVERLAY_VISIBLE):
+        return
+    # verbose_print("... (Waiting for overlay to disappear)", verbose)
+    wait_for_dom_condition(current_driver_obj, JS_BUSY_OVERLAY_GONE, BUSY_OVERLAY_TIMEOUT)
+
+
+# Async script template: CHECK_BODY is replaced by a function body that returns a boolean and can
+#   read its arguments from `args`. Calls back with true as soon as the check holds (checked at once,
+#   then after DOM changes, at most every 50 ms), or with false after arguments[0] milliseconds.
+JS_WAIT_FOR_DOM_CONDITION = """
+    const done = arguments[arguments.length - 1];
+    const args = Array.prototype.slice.call(arguments, 1, -1);
+    const check = function () { CHECK_BODY };
+    if (check()) return done(true);
+    let finished = false, scheduled = false;
+    const observer = new MutationObserver(() => {
+        if (scheduled) return;
+        scheduled = true;
+        setTimeout(() => { scheduled = false; if (check()) finish(true); }, 50);
+    });
+    const timer = setTimeout(() => finish(false), arguments[0]);
+    function finish(result) {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        done(result);
+    }
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Longest time one observer script may run (below Selenium's default 30 s script timeout)
+DOM_CONDITION_SCRIPT_SECONDS = 20
+
+def wait_for_dom_condition(driver, check_body, timeout, *args):
+    """
+    Wait until a script condition holds, reacting to DOM changes instead of polling.
+    
+    A MutationObserver in the page re-checks the condition when the page changes and the
+    script returns as soon as it holds. Each script runs for at most
+    DOM_CONDITION_SCRIPT_SECONDS and is started again until the timeout.
+    
+    Args:
+        driver: WebDriver instance
+        check_body: JavaScript function body returning true when the wait is over; its
+            arguments are available as `args`
+        timeout: Seconds to wait in total
+        *args: Arguments for the check
+    
+    Raises:
+        TimeoutException: If the condition doesn't hold within the timeout
+    
+    Example:
+        wait_for_dom_condition(mydriver, "return document.querySelectorAll('li.done').length >= args[0];", 60, 3)
+    """
+    script = JS_WAIT_FOR_DOM_CONDITION.replace("CHECK_BODY", check_body)
+    deadline = monotonic() + timeout
+    while True:
+        script_ms = int(max(0, min(deadline - monotonic(), DOM_CONDITION_SCRIPT_SECONDS)) * 1000)
+        try:
+            if driver.execute_async_script(script, script_ms, *args):
+                return
+        except WebDriverException:
+            # The page was replaced while the script ran; check the new page
+            if driver.execute_script("const args = arguments; " + check_body, *args):
+                return
+        if monotonic() >= deadline:
+            raise TimeoutException(f"Condition not met after {timeout} seconds")
+
+# Returns "busy" while the "busy" overlay is shown, otherwise the first element matching the CSS
+#   selector arguments[0] if it is displayed and enabled, or null
+JS_CLICKABLE_WHEN_IDLE = """
+    const busy = document.getElementById('busy');
+    if (busy && busy.getClientRects().length > 0) return 'busy';
+    const el = document.querySelector(arguments[0]);
+    return el && !el.disabled && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden' ? el : null;
+"""
+
+def wait_for_clickable(driver, wait, locator, verbose):
+    """
+    Wait until an element can be clicked and the "busy" overlay is gone.
+    
+    Combines EC.element_to_be_clickable() and wait_for_obscuring_elements(): both are
+    checked by one script call per poll, instead of one call for the lookup, two for the
+    displayed and enabled checks and one for the overlay. While the overlay is shown, it is
+    waited for as in wait_for_obscuring_elements().
+    
+    Args:
+        driver: WebDriver instance
+        wait: WebDriverWait to poll with
+        locator: (By.CSS_SELECTOR, selector) tuple
+        verbose: Whether verbose logging is enabled
+    
+    Returns:
+        The clickable WebElement
+    
+    Raises:
+        TimeoutException: If the element is not clickable within the wait's timeout
+    
+    Example:
+        wait_for_clickable(mydriver, wait_med, LOC_DATATYPES_EDIT, args.verbose).click()
+    """
+    def clickable_when_idle(d):
+        element = d.execute_script(JS_CLICKABLE_WHEN_IDLE, locator[1])
+        if element == 'busy':
+            wait_for_obscuring_elements(d, verbose)
+            return False
+        return element
+    return wait.until(clickable_when_idle)
+
+def load_csv_data(csv_file):
+    """
+    Read every data row of the CSV file once, so rows can be looked up by index afterwards.
+    CSV files are expected to be UTF-8-sig encoded.
+    
+    Rows are kept as plain lists; read_csv_line() turns only the rows that are actually
+    processed into dictionaries.
+    
+    Args:
+        csv_file: Path to the CSV file
+    
+    Returns:
+        Tuple of (header: list of column names, rows: list of row value lists, header excluded)
+    
+    Example:
+        csv_data = load_csv_data("data.csv")
+        datadict = read_csv_line(csv_data, 3)
+    """
     with open(csv_file, "r", encoding='utf-8-sig', newline='') as datafile:
-        datareader = csv.DictReader(datafile)
-        for i, singlerow in enumerate(datareader):
-            if i == (line_to_process - 1):  # -1 because i starts counting at 0
-                return singlerow  # is already a dictionary
-        # If we get here, the line wasn't found
-        raise ValueError(f"Line {line_to_process} not found in CSV file (file has fewer rows)")
+        reader = csv.reader(datafile)
+        header = next(reader, [])
+        return header, list(reader)
+
+
+def read_csv_line(csv_data, line_to_process):
+    # gets the input from the specified line of the csv file, to put it in the datalumos forms.
+    # csv_data is the (header, rows) tuple returned by load_csv_data(); line_to_process counts from 1 (excluding the header row)
+    header, rows = csv_data
+    if line_to_process < 1 or line_to_process > len(rows):
+        raise ValueError(f"Line {line_to_process} not found in CSV file (file has {len(rows)} rows)")
+    row = rows[line_to_process - 1]  # -1 because the list index starts counting at 0
+    # short rows get empty strings for their missing trailing cells
+    return dict(zip(header, row + [''] * (len(header) - len(row))))
+
+# Upload file lists by project folder path, with the folder's modification time they were read at,
+#   so a row that is retried doesn't rescan its folder unless files were added, removed or renamed
+upload_paths_cache = {}
 
 def get_paths_uploadfiles(folderpath, projectfolder):
     # Builds a list with all the single file paths to be uploaded. Takes as argument the path to the parent folder,
@@ -395,60 +810,305 @@ def get_paths_uploadfiles(folderpath, projectfolder):
     if mypath[0:2] == ".\\" or mypath[0:2] == "./":
         # eliminate the first two characters, the dot and the slash:
         mypath = mypath[2:]
-    operatingsystem = os.name
-    if operatingsystem == "posix":  # for linux or mac
-        mypath = mypath.replace("\\", "/")
-        folderpath = folderpath.replace("\\", "/")
-    elif operatingsystem == "nt":  # for windows
-        mypath = mypath.replace("/", "\\")
-        folderpath = folderpath.replace("\\", "/")
+    mypath = mypath.replace(FOREIGN_PATH_SEP, os.sep)
+    folderpath = folderpath.replace("\\", "/")
     combinedpath = os.path.join(folderpath, mypath)
-    uploadfiles_names = os.listdir(combinedpath)
-    # build the complete paths for the files that should be uploaded, by joining the single parts of the path:
-    uploadfiles_paths = [os.path.join(combinedpath, filename) for filename in uploadfiles_names]
-    return uploadfiles_paths
-
-def drag_and_drop_file(drop_target, path):
-    # the function fakes the drag-and-drop that drags a file from the computer into a specific area to upload it.
-    # THE COMPLETE CODE OF THIS FUNCTION IS TAKEN FROM STACKOVERFLOW:
-    #   https://stackoverflow.com/questions/43382447/python-with-selenium-drag-and-drop-from-file-system-to-webdriver
-
-    # javascript code that will be executed by selenium:
-    JS_DROP_FILE = """
-        var target = arguments[0],
-            offsetX = arguments[1],
-            offsetY = arguments[2],
-            document = target.ownerDocument || document,
-            window = document.defaultView || window;
-    
-        var input = document.createElement('INPUT');
-        input.type = 'file';
-        input.onchange = function () {
-          var rect = target.getBoundingClientRect(),
-              x = rect.left + (offsetX || (rect.width >> 1)),
-              y = rect.top + (offsetY || (rect.height >> 1)),
-              dataTransfer = { files: this.files };
-    
-          ['dragenter', 'dragover', 'drop'].forEach(function (name) {
-            var evt = document.createEvent('MouseEvent');
-            evt.initMouseEvent(name, !0, !0, window, 0, 0, 0, x, y, !1, !1, !1, !1, 0, null);
-            evt.dataTransfer = dataTransfer;
-            target.dispatchEvent(evt);
-          });
-    
-          setTimeout(function () { document.body.removeChild(input); }, 25);
-        };
-        document.body.appendChild(input);
-        return input;
+    folder_mtime = os.stat(combinedpath).st_mtime_ns
+    cached = upload_paths_cache.get(combinedpath)
+    if cached is None or cached[0] != folder_mtime:
+        # scandir yields entries that already carry the full path and file type, so no extra join or stat per file
+        with os.scandir(combinedpath) as entries:
+            cached = (folder_mtime, [entry.path for entry in entries if entry.is_file()])
+        upload_paths_cache[combinedpath] = cached
+    return list(cached[1])
+
+# javascript code that fakes the drag-and-drop of files from the computer into a drop area (used by drag_and_drop_files):
+#   it creates a file input; once files are set on it, their drop onto the target is simulated.
+# THE ORIGINAL CODE IS TAKEN FROM STACKOVERFLOW:
+#   https://stackoverflow.com/questions/43382447/python-with-selenium-drag-and-drop-from-file-system-to-webdriver
+JS_DROP_FILE = """
+    var target = arguments[0],
+        offsetX = arguments[1],
+        offsetY = arguments[2],
+        document = target.ownerDocument || document,
+        window = document.defaultView || window;
+
+    var input = document.createElement('INPUT');
+    input.type = 'file';
+    input.multiple = true;
+    input.onchange = function () {
+      var rect = target.getBoundingClientRect(),
+          x = rect.left + (offsetX || (rect.width >> 1)),
+          y = rect.top + (offsetY || (rect.height >> 1)),
+          dataTransfer = { files: this.files };
+
+      ['dragenter', 'dragover', 'drop'].forEach(function (name) {
+        var evt = document.createEvent('MouseEvent');
+        evt.initMouseEvent(name, !0, !0, window, 0, 0, 0, x, y, !1, !1, !1, !1, 0, null);
+        evt.dataTransfer = dataTransfer;
+        target.dispatchEvent(evt);
+      });
+
+      setTimeout(function () { document.body.removeChild(input); }, 25);
+    };
+    document.body.appendChild(input);
+    // keep a handle so the input can be addressed through the DevTools protocol
+    window.__dropFileInput = input;
+    return input;
+"""
+
+# Returns the page's own file input next to the drop area (inside the same modal, possibly hidden),
+#   if it can take arguments[1] files at once, or null
+JS_FIND_NATIVE_FILE_INPUT = """
+    var scope = arguments[0].closest('.modal') || arguments[0], count = arguments[1];
+    return Array.from(scope.querySelectorAll("input[type='file']")).find(function (input) {
+        return input.multiple || count === 1;
+    }) || null;
+"""
+
+def drag_and_drop_files(drop_target, paths):
+    """
+    Drop several files onto the upload area at once.
+    
+    If the upload dialog has its own file input that takes all the files, the paths are sent
+    to it directly and no drop is faked. Otherwise all files go through one helper input
+    (which accepts multiple files), so a single drop carries every file. On Chrome/Chromium
+    the files are set with one DevTools protocol command (DOM.setFileInputFiles); other
+    browsers get the newline-separated paths through send_keys, which WebDriver treats as
+    a multi-file selection.
+    
+    Args:
+        drop_target: WebElement of the drop area
+        paths: List of absolute file paths
+    
+    Example:
+        drag_and_drop_files(fileupload_field, ["C:\\data\\x\\data.csv", "C:\\data\\x\\page.pdf"])
     """
     driver = drop_target.parent
+    native_input = driver.execute_script(JS_FIND_NATIVE_FILE_INPUT, drop_target, len(paths))
+    if native_input is not None:
+        native_input.send_keys("\n".join(paths))
+        return
     file_input = driver.execute_script(JS_DROP_FILE, drop_target, 0, 0)
-    file_input.send_keys(path)
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        file_input.send_keys("\n".join(paths))
+        return
+    remote_object = driver.execute_cdp_cmd("Runtime.evaluate", {"expression": "window.__dropFileInput"})
+    driver.execute_cdp_cmd("DOM.setFileInputFiles", {"files": list(paths), "objectId": remote_object["result"]["objectId"]})
+
+
+def set_input_value(driver, element, text):
+    """
+    Set the value of an <input> in a single browser round-trip.
+    
+    Uses the native value setter so React-controlled inputs (the DataLumos forms) pick up
+    the change, then fires the input and change events the page listens for.
+    
+    Args:
+        driver: WebDriver instance
+        element: The input WebElement
+        text: Value to set
+    
+    Example:
+        set_input_value(mydriver, project_title_form, "My project title")
+    """
+    set_input_values(driver, [(element, text)])
+
+
+# Sets the value of each [input, text] pair in arguments[0] with the native setter and fires input/change
+JS_SET_INPUT_VALUES = """
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [el, text] of arguments[0]) {
+        el.focus();
+        setter.call(el, text);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+"""
+
+def set_input_values(driver, values):
+    """
+    Set the values of several <input>s of one form in a single browser round-trip.
+    
+    Each input is set as in set_input_value(), in the given order.
+    
+    Args:
+        driver: WebDriver instance
+        values: List of (input WebElement, value) pairs
+    
+    Example:
+        set_input_values(mydriver, [(time_period_start, "2020-01"), (time_period_end, "2024")])
+    """
+    driver.execute_script(JS_SET_INPUT_VALUES, [[element, text] for element, text in values])
+
+
+# Clicks every radio button/checkbox with an ID in arguments[0] that isn't checked yet (a real click, so the
+#   page's handlers run); returns the IDs that were not found
+JS_CHECK_INPUTS = """
+    const missing = [];
+    for (const id of arguments[0]) {
+        const el = document.getElementById(id);
+        if (!el) missing.push(id);
+        else if (!el.checked) el.click();
+    }
+    return missing;
+"""
+
+def check_inputs(driver, locators):
+    """
+    Check several radio buttons/checkboxes of one form in a single browser round-trip.
+    
+    Inputs that are already checked are left alone, so a checkbox isn't unchecked again.
+    
+    Args:
+        driver: WebDriver instance
+        locators: List of (By.ID, id) locators of the inputs
+    
+    Raises:
+        NoSuchElementException: If one of the inputs is not on the page
+    
+    Example:
+        check_inputs(mydriver, [LOC_NO_DISCLOSURE, LOC_SENSITIVE_NO])
+    """
+    missing = driver.execute_script(JS_CHECK_INPUTS, [element_id for _, element_id in locators])
+    if missing:
+        raise NoSuchElementException(f"Inputs not found: {', '.join(missing)}")
+
+
+# Sets the value of the input arguments[0] to arguments[1] like set_input_value() and submits its
+#   form the way WebElement.submit() does (submit event first; the page's handler may cancel the native submit)
+JS_SET_INPUT_VALUE_AND_SUBMIT = """
+    const el = arguments[0], form = el.form;
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    el.focus();
+    setter.call(el, arguments[1]);
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    if (form.dispatchEvent(new Event('submit', { bubbles: true, cancelable: true }))) {
+        HTMLFormElement.prototype.submit.call(form);
+    }
+"""
+
+def edit_inline_field(driver, wait, edit_locator, text, verbose):
+    """
+    Fill in a single-line field of the project workspace that is edited inline (x-editable).
+    
+    Clicks the field's edit link, waits for the inline input and then sets the value and
+    submits the inline form in one script call.
+    
+    Args:
+        driver: WebDriver instance
+        wait: WebDriverWait to use for the edit link and the input
+        edit_locator: Locator of the field's "edit" link
+        text: Value to enter
+        verbose: Whether verbose logging is enabled
+    
+    Example:
+        edit_inline_field(mydriver, wait_med, LOC_GEOGRAPHIC_EDIT, "United States", args.verbose)
+    """
+    edit_link = wait_for_clickable(driver, wait, edit_locator, verbose)
+    edit_link.click()
+    inline_input = wait.until(EC.presence_of_element_located(LOC_EDITABLE_INPUT))
+    wait_for_obscuring_elements(driver, verbose)
+    driver.execute_script(JS_SET_INPUT_VALUE_AND_SUBMIT, inline_input, text)
+
+
+# Returns the text content of the body of the WYSIWYG editor iframe arguments[0], or null while it has no body
+JS_WYSIWYG_TEXT = """
+    const doc = arguments[0].contentDocument;
+    return doc && doc.body ? doc.body.textContent : null;
+"""
+
+def set_wysiwyg_text(driver, iframe, text, timeout=5):
+    """
+    Replace the content of the WYSIWYG editor body in a single browser round-trip.
+    
+    The editor body is reached through the iframe's contentDocument, so the driver stays in
+    the main page (no switch_to.frame()/default_content()). Focuses the body, sets its text
+    and fires the input event so the editor registers the change. The same script reads the
+    content back; only if the editor has not (yet) taken the text is it polled again, for up
+    to `timeout` seconds.
+    
+    Args:
+        driver: WebDriver instance
+        iframe: The wysihtml5 editor iframe WebElement (its body must exist)
+        text: Plain text to put in the editor
+        timeout: Seconds to wait for the editor to show the text (default: 5)
+    
+    Returns:
+        bool: True if the editor content matches the text, False if it didn't within the timeout
+    
+    Example:
+        if not set_wysiwyg_text(mydriver, wysihtml5_iframe, "Summary of the dataset"):
+            row_warnings.append("Summary text could not be confirmed in the editor")
+    """
+    content = driver.execute_script("""
+        const body = arguments[0].contentDocument.body;
+        body.focus();
+        body.textContent = arguments[1];
+        body.dispatchEvent(new Event('input', { bubbles: true }));
+        return body.textContent;
+    """, iframe, text)
+    if content.strip() == text.strip():
+        return True
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            lambda d: (d.execute_script(JS_WYSIWYG_TEXT, iframe) or "").strip() == text.strip())
+        return True
+    except TimeoutException:
+        return False
+
+
+# Selects the keywords in arguments[0] that are options of the keywords field's <select> (the select2
+#   field that holds the LOC_KEYWORDS search box), then returns the keywords that are not selected
+#   afterwards; returns null if jQuery/select2 or the field is not on the page
+JS_SELECT_KEYWORDS = """
+    const keywords = arguments[0];
+    const $ = window.jQuery;
+    if (!$ || !$.fn || !$.fn.select2) return null;
+    const $select = $('.select2-search__field').closest('.select2-container').prev('select.select2-hidden-accessible');
+    if (!$select.length) return null;
+    const options = Array.from($select[0].options);
+    keywords.forEach(function (keyword) {
+        const option = options.find(o => o.text === keyword || o.value === keyword);
+        if (!option || option.selected) return;
+        option.selected = true;
+        $select.trigger({ type: 'select2:select', params: { data: { id: option.value, text: option.text } } });
+    });
+    $select.trigger('change');
+    const selected = new Set(Array.from($select[0].selectedOptions).map(o => o.text));
+    return keywords.filter(keyword => !selected.has(keyword));
+"""
+
+def insert_keywords_bulk(driver, keywords):
+    """
+    Select the keywords in the select2 subject-terms field in one script call.
+    
+    Only keywords that exactly match an option of the field are selected, as with the
+    suggestions when typing them; the selection is read back afterwards.
+    
+    Args:
+        driver: WebDriver instance
+        keywords: List of keyword strings
+    
+    Returns:
+        List of the keywords that are not selected (all of them if jQuery/select2 or the field
+        is not available on the page); the caller enters these one by one
+    
+    Example:
+        for keyword in insert_keywords_bulk(mydriver, ["Health", "Vaccines"]):
+            ...   # type the keyword and pick its suggestion
+    """
+    remaining = driver.execute_script(JS_SELECT_KEYWORDS, keywords)
+    return list(keywords) if remaining is None else remaining
 
 
 def check_csv_writability(csv_file_path):
     """
-    Check if the CSV file is writable by attempting to read and write it.
+    Check if the CSV file is writable by opening it for writing and taking an exclusive lock.
+    
+    Neither reads nor rewrites the file: opening fails if the file is read-only (or, on
+    Windows, open in Excel), and the lock fails if another program holds one on it.
     
     Args:
         csv_file_path: Path to the CSV file
@@ -457,15 +1117,17 @@ def check_csv_writability(csv_file_path):
         Tuple of (success: bool, error_message: str or None)
     """
     try:
-        # CSV files are expected to be UTF-8-sig encoded
-        df = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-        
-        # Ensure datalumos_id column exists
-        if 'datalumos_id' not in df.columns:
-            df['datalumos_id'] = ''
-        
-        # Try to write the file back (this checks writability)
-        df.to_csv(csv_file_path, index=False, encoding='utf-8-sig')
+        fd = os.open(csv_file_path, os.O_RDWR)
+        try:
+            if msvcrt:
+                # lock (and release) the first byte, without waiting
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
         return True, None
     except (PermissionError, IOError, OSError) as e:
         error_msg = f"CSV file is not writable: {csv_file_path}\n   Error: {str(e)}\n   Please close the file if it's open in Excel or another program."
@@ -475,35 +1137,41 @@ def check_csv_writability(csv_file_path):
         return False, error_msg
 
 
-def update_csv_workspace_id(csv_file_path, row_number, workspace_id):
+# Serializes the updates of the CSV file when several workers run in parallel
+csv_update_lock = threading.Lock()
+
+# The CSV files being updated, by path; each is read once and then only written
+workspace_id_csvs = {}
+
+def update_csv_workspace_id(csv_file_path, row_number, workspace_id, interactive=True):
     """
     Update the CSV file with the workspace ID in the datalumos_id column.
     
+    The file is read on the first update only; later updates change the copy in memory
+    and write it back. Safe to call from several worker threads; updates are applied one at a time.
+    
     Args:
         csv_file_path: Path to the CSV file
         row_number: Row number (1-indexed, excluding header)
         workspace_id: Workspace ID to write
+        interactive: Whether to ask the user to close the file when it is locked; otherwise
+            wait a few seconds before retrying (default: True)
     """
+    with csv_update_lock:
+        _update_csv_workspace_id(csv_file_path, row_number, workspace_id, interactive)
+
+
+def _update_csv_workspace_id(csv_file_path, row_number, workspace_id, interactive):
     max_retries = 3
     retry_count = 0
     
     while retry_count < max_retries:
         try:
-            # CSV files are expected to be UTF-8-sig encoded
-            df = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-            
-            # Ensure datalumos_id column exists and is string type
-            if 'datalumos_id' not in df.columns:
-                df['datalumos_id'] = ''
-            
-            # Convert column to string type to avoid dtype warnings
-            df['datalumos_id'] = df['datalumos_id'].astype(str)
-            
-            # Update the specific row (row_number is 1-indexed, excluding header, so it maps to index row_number - 1)
-            df.loc[row_number - 1, 'datalumos_id'] = str(workspace_id)
-            
-            # Write back to CSV using UTF-8-sig
-            df.to_csv(csv_file_path, index=False, encoding='utf-8-sig')
+            if csv_file_path not in workspace_id_csvs:
+                workspace_id_csvs[csv_file_path] = WorkspaceIdCsv(csv_file_path)
+            id_csv = workspace_id_csvs[csv_file_path]
+            id_csv.set(row_number, workspace_id)
+            id_csv.flush()
             return  # Success, exit the function
         except (PermissionError, IOError, OSError) as e:
             # File is likely open in another program (Excel, etc.)
@@ -512,7 +1180,11 @@ def update_csv_workspace_id(csv_file_path, row_number, workspace_id):
                 print(f"\n⚠ WARNING: Could not write to CSV file: {csv_file_path}")
                 print(f"   Error: {str(e)}")
                 print(f"   Please close the file if it's open in Excel or another program.")
-                input("   Press Enter after closing the file to retry...")
+                if interactive:
+                    input("   Press Enter after closing the file to retry...")
+                else:
+                    print("   Retrying in 5 seconds...")
+                    sleep(5)
             else:
                 print(f"\n⚠ WARNING: Could not update CSV file after {max_retries} attempts: {csv_file_path}")
                 print(f"   Error: {str(e)}")
@@ -576,7 +1248,92 @@ def format_exception_for_logging(exception, include_location=True):
     return error_msg
 
 
-def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
+# Returns the first displayed element matching the CSS selector arguments[0] whose trimmed text
+#   equals (arguments[2] true) or contains (false) arguments[1], or null
+JS_FIND_BY_TEXT = """
+    var text = arguments[1].trim(), exact = arguments[2];
+    return Array.from(document.querySelectorAll(arguments[0])).find(function (el) {
+        var elText = el.innerText.trim();
+        return (exact ? elText === text : elText.indexOf(text) !== -1)
+            && el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    }) || null;
+"""
+
+def find_by_text(driver, css_selector, text, exact=True):
+    """
+    Find a displayed element by its text among the elements matching a CSS selector.
+    
+    Replaces XPath text() predicates and Python loops over find_elements(): the candidates
+    are filtered in the browser in a single round-trip, and the text is passed as an
+    argument, so quotes in it need no escaping. Returns None instead of raising, so it
+    can be used directly as a WebDriverWait condition.
+    
+    Args:
+        driver: WebDriver instance
+        css_selector: CSS selector for the candidate elements
+        text: Text to look for (it and the element texts are compared after stripping surrounding whitespace)
+        exact: True to require the whole text to match, False to accept elements containing it
+    
+    Returns:
+        The first matching WebElement, or None
+    
+    Example:
+        keyword_sugg = wait.until(lambda d: find_by_text(d, "li.select2-results__option", "Vaccines"))
+    """
+    return driver.execute_script(JS_FIND_BY_TEXT, css_selector, text, exact)
+
+
+def add_agency(mydriver, finder, agency, timeout, verbose):
+    """
+    Add one government agency to the project through the "add value" organization modal.
+    
+    Args:
+        mydriver: WebDriver instance
+        finder: CachedFinder for the current page
+        agency: Agency name to enter
+        timeout: Seconds to wait for each element of the modal
+        verbose: Whether verbose logging is enabled
+    """
+    wait = finder.wait(timeout)
+    add_gvmnt_value = wait_for_clickable(mydriver, wait, LOC_AGENCY_ADD_VALUE, verbose)
+    verbose_print("add_gvmnt_value found", verbose)
+    add_gvmnt_value.click()
+    # <a href="#org" aria-controls="org" role="tab" data-toggle="tab" data-reactid=".2.0.0.1.0.1.0">Organization/Agency</a>
+    #    css-selector: div.modal:nth-child(1) > div:nth-child(1) > div:nth-child(1) > div:nth-child(2) > ul:nth-child(1) > li:nth-child(2) > a:nth-child(1)
+    agency_tab = wait.until(EC.element_to_be_clickable(LOC_AGENCY_TAB))
+    verbose_print("agency_tab found", verbose)
+    wait_for_obscuring_elements(mydriver, verbose)
+    agency_tab.click()
+    # <input type="text" name="orgName" id="orgName" required="" class="form-control ui-autocomplete-input" value="" data-reactid=".2.0.0.1.1.1.0.0.0.1.0.0.0.1.0" autocomplete="off">
+    agency_field = wait.until(EC.presence_of_element_located(LOC_ORG_NAME))
+    agency_field.send_keys(agency)
+    # Wait for the suggestion dropdown to appear (it may not, if nothing matches the name)
+    try:
+        finder.wait(AUTOCOMPLETE_APPEAR_TIMEOUT).until(EC.visibility_of_element_located(LOC_AUTOCOMPLETE_ITEM))
+    except TimeoutException:
+        pass
+    # Click on the Organization Name label (or another neutral spot in the modal) to dismiss the dropdown;
+    #   the candidates are tried in order inside the browser, so this is one round-trip
+    dismiss_target = mydriver.execute_script(JS_FIND_DROPDOWN_DISMISS_TARGET)
+    try:
+        if dismiss_target is None:
+            raise ValueError("no label or modal header to click")
+        dismiss_target.click()
+    except Exception:
+        # Last resort: press Escape key to close dropdown
+        agency_field.send_keys(Keys.ESCAPE)
+    # the dropdown must be gone before it can cover the save button
+    try:
+        finder.wait(AUTOCOMPLETE_CLOSE_TIMEOUT).until(EC.invisibility_of_element_located(LOC_AUTOCOMPLETE_ITEM))
+    except TimeoutException:
+        pass
+    # submit: <button type="button" class="btn btn-primary save-org" data-reactid=".2.0.0.1.1.1.0.0.0.1.0.0.1.0.0">Save &amp; Apply</button>
+    #   .save-org
+    wait_for_obscuring_elements(mydriver, verbose)
+    finder.click(LOC_SAVE_ORG, timeout=timeout)
+
+
+def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings, workspace_fresh=False):
     """
     Fill in all project forms with data from CSV.
     
@@ -586,80 +1343,77 @@ def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
         args: Parsed command-line arguments
         row_errors: List to append errors to
         row_warnings: List to append warnings to
+        workspace_fresh: True if the browser shows the workspace just loaded by the sign-in,
+            so it isn't loaded again (default: False)
     
     Returns:
         workspace_id: Extracted workspace ID or None
+    
+    Raises:
+        RowSkippedError: If the project folder doesn't hold exactly 2 files to upload
     """
     workspace_id = None
+    # Normalized values of this row (empty/whitespace-only cells are "")
+    row = RowData(datadict)
+    
+    # Check the files to upload before anything is done in the browser, so a row that
+    #   can't be uploaded doesn't leave a half-filled project behind
+    if row.path:
+        filepaths_to_upload = get_paths_uploadfiles(args.folder_path_uploadfiles, row.path)
+        if len(filepaths_to_upload) != 2:
+            raise RowSkippedError(f"The number of files to upload is not 2: {len(filepaths_to_upload)} in {row.path} - project not created")
+        filenames_to_upload = [os.path.basename(f) for f in filepaths_to_upload]
+    
+    # One wait object per timeout tier, reused for every lookup in this row;
+    # selectors that are looked up repeatedly go through finder.find() to reuse the element
+    finder = CachedFinder(mydriver, poll_frequency=POLL_FREQUENCY)
+    wait_short = finder.wait(10)
+    wait_med = finder.wait(50)
+    wait_long = finder.wait(100)
+    wait_page = finder.wait(360)
     
     # Normal mode: create project and fill forms
     
-    # Navigate to workspace page
+    # Navigate to workspace page (already shown for the first row after the sign-in)
     verbose_print("Navigating to workspace...", args.verbose)
-    # Increase page load timeout for this operation (extend to 120 seconds)
-    if hasattr(mydriver, 'set_page_load_timeout'):
-        original_timeout = None
-        try:
-            original_timeout = mydriver.get_page_load_timeout()
-        except:
-            pass  # get_page_load_timeout() might not be available on all drivers
-        
-        try:
-            mydriver.set_page_load_timeout(120)  # 120 seconds timeout
-            mydriver.get("https://www.datalumos.org/datalumos/workspace")
-        finally:
-            # Restore original timeout if it existed
-            if original_timeout is not None:
-                try:
-                    mydriver.set_page_load_timeout(original_timeout)
-                except:
-                    pass
-            else:
-                # Reset to default (typically 30 seconds) if no original timeout was set
-                try:
-                    mydriver.set_page_load_timeout(30)
-                except:
-                    pass
-    else:
-        # Fallback if set_page_load_timeout is not available
-        mydriver.get("https://www.datalumos.org/datalumos/workspace")
-    wait_for_verification(mydriver)
+    if navigate(mydriver, url_datalumos, workspace_fresh):
+        wait_for_verification(mydriver)
     
-    new_project_btn = WebDriverWait(mydriver, 360).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".btn > span:nth-child(3)"))) # .btn > span:nth-child(3)
+    new_project_btn = wait_for_clickable(mydriver, wait_page, LOC_NEW_PROJECT_BTN, args.verbose) # .btn > span:nth-child(3)
     verbose_print("button found", args.verbose)
-    wait_for_obscuring_elements(mydriver, args.verbose)
     new_project_btn.click()
 
-    verbose_print(f"Processing row, Title: {datadict['4_title']}\n", args.verbose)
+    verbose_print(f"Processing row, Title: {row.title}\n", args.verbose)
 
 
     # --- Title
 
     # <input type="text" class="form-control" name="title" id="title" value="" data-reactid=".2.0.0.1.2.0.$0.$0.$0.$displayPropKey2.0.2.0">
-    project_title_form = WebDriverWait(mydriver, 10).until(EC.presence_of_element_located((By.ID, "title")))
-    # title with pre-title (if existent):
-    title = datadict.get("4_title", "") or ""
-    pre_title = datadict.get("4_pre_title", "") or ""
-    pojecttitle = title if len(pre_title) == 0 else pre_title + " " + title
-    project_title_form.send_keys(pojecttitle)
+    project_title_form = wait_short.until(EC.presence_of_element_located(LOC_TITLE))
+    # title with pre-title (if existent), see RowData
+    set_input_value(mydriver, project_title_form, row.title)
     # .save-project
-    project_title_apply = WebDriverWait(mydriver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".save-project")))
+    project_title_apply = wait_short.until(EC.element_to_be_clickable(LOC_SAVE_PROJECT))
     verbose_print("project_title_apply - found", args.verbose)
     project_title_apply.click()
     # <a role="button" class="btn btn-primary" href="workspace?goToPath=/datalumos/239181&amp;goToLevel=project" data-reactid=".2.0.0.1.2.1.0.0.0">Continue To Project Workspace</a>
     #   CSS-selector: a.btn-primary
-    project_title_apply2 = WebDriverWait(mydriver, 100).until(EC.presence_of_element_located((By.LINK_TEXT, "Continue To Project Workspace")))
+    project_title_apply2 = wait_long.until(EC.element_to_be_clickable(LOC_CONTINUE_TO_WORKSPACE))
     verbose_print("Continue To Project Workspace - found", args.verbose)
     project_title_apply2.click()
+    finder.invalidate()
     
     # Wait for navigation to complete
     wait_for_obscuring_elements(mydriver, args.verbose)
-    sleep(1)
+    try:
+        wait_short.until(EC.url_matches(WORKSPACE_ID_RE))
+    except TimeoutException:
+        pass  # reported below as a warning when the workspace ID can't be extracted
     
     # Extract workspace ID from current URL after navigating to workspace
     current_url = mydriver.current_url
     # Look for /datalumos/ followed by digits in the URL
-    match = re.search(r'/datalumos/(\d+)', current_url)
+    match = WORKSPACE_ID_RE.search(current_url)
     if match:
         workspace_id = match.group(1)
         verbose_print(f"✓ Workspace ID: {workspace_id} (from URL: {current_url})", args.verbose)
@@ -673,16 +1427,14 @@ def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
 
     # collapse all: <span data-reactid=".0.3.1.1.0.1.2.0.1.0.1.1"> Collapse All</span>
     #   css-selector: #expand-init > span:nth-child(2)
-    collapse_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#expand-init > span:nth-child(2)")))
-    wait_for_obscuring_elements(mydriver, args.verbose)
+    collapse_btn = wait_for_clickable(mydriver, wait_med, LOC_EXPAND_TOGGLE, args.verbose)
     collapse_btn.click()
-    sleep(2)
+    wait_med.until(EC.text_to_be_present_in_element(LOC_EXPAND_TOGGLE, "Expand"))
     # expand all: <span data-reactid=".0.3.1.1.0.1.2.0.1.0.1.1"> Expand All</span>
     #   CSS-selector:    #expand-init > span:nth-child(2)
-    expand_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#expand-init > span:nth-child(2)")))
-    wait_for_obscuring_elements(mydriver, args.verbose)
+    expand_btn = wait_for_clickable(mydriver, wait_med, LOC_EXPAND_TOGGLE, args.verbose)
     expand_btn.click()
-    sleep(2)
+    wait_med.until(EC.text_to_be_present_in_element(LOC_EXPAND_TOGGLE, "Collapse"))
 
 
 
@@ -690,90 +1442,34 @@ def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
 
     # government add value: <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$0.$0.0.$displayPropKey1.0.2.2"> add value</span>
     #   CSS-selector: #groupAttr0 > div:nth-child(1) > div:nth-child(1) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)
-    agency_investigator = [datadict["5_agency"], datadict["5_agency2"]]
-    for singleinput in agency_investigator:
-        if len(singleinput) != 0 and singleinput != " ":
-            add_gvmnt_value = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#groupAttr0 > div:nth-child(1) > div:nth-child(1) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)")))
-            verbose_print("add_gvmnt_value found", args.verbose)
-            wait_for_obscuring_elements(mydriver, args.verbose)
-            add_gvmnt_value.click()
-            # <a href="#org" aria-controls="org" role="tab" data-toggle="tab" data-reactid=".2.0.0.1.0.1.0">Organization/Agency</a>
-            #    css-selector: div.modal:nth-child(1) > div:nth-child(1) > div:nth-child(1) > div:nth-child(2) > ul:nth-child(1) > li:nth-child(2) > a:nth-child(1)
-            agency_tab = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.LINK_TEXT, "Organization/Agency")))
-            verbose_print("agency_tab found", args.verbose)
-            wait_for_obscuring_elements(mydriver, args.verbose)
-            agency_tab.click()
-            # <input type="text" name="orgName" id="orgName" required="" class="form-control ui-autocomplete-input" value="" data-reactid=".2.0.0.1.1.1.0.0.0.1.0.0.0.1.0" autocomplete="off">
-            agency_field = WebDriverWait(mydriver, 100).until(EC.presence_of_element_located((By.ID, "orgName")))
-            agency_field.send_keys(singleinput)
-            # Wait a moment for the dropdown to appear
-            sleep(0.5)
-            # Click on the Organization Name label to dismiss the dropdown
-            try:
-                # Try to find label associated with orgName field
-                org_label = mydriver.find_element(By.CSS_SELECTOR, "label[for='orgName']")
-                org_label.click()
-                sleep(0.3)
-            except Exception:
-                # Fallback: try clicking on text "Organization Name" or modal header
-                try:
-                    org_label = WebDriverWait(mydriver, 5).until(EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), 'Organization') or contains(text(), 'Agency')]")))
-                    org_label.click()
-                    sleep(0.3)
-                except Exception:
-                    # If label not found, try clicking elsewhere in the modal to dismiss dropdown
-                    try:
-                        modal_header = mydriver.find_element(By.CSS_SELECTOR, ".modal-header, .modal-title")
-                        modal_header.click()
-                        sleep(0.3)
-                    except Exception:
-                        # Last resort: press Escape key to close dropdown
-                        agency_field.send_keys(Keys.ESCAPE)
-                        sleep(0.3)
-            # submit: <button type="button" class="btn btn-primary save-org" data-reactid=".2.0.0.1.1.1.0.0.0.1.0.0.1.0.0">Save &amp; Apply</button>
-            #   .save-org
-            wait_for_obscuring_elements(mydriver, args.verbose)
-            submit_agency_btn = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".save-org")))
-            submit_agency_btn.click()
+    # The first agency may have to wait for the freshly expanded form; once one has gone through,
+    #   the modal is known to respond quickly, so later ones use a shorter timeout
+    agency_timeout = 100
+    for singleinput in row.agencies:
+        add_agency(mydriver, finder, singleinput, agency_timeout, args.verbose)
+        agency_timeout = 20
 
 
     # --- Summary
 
-    summarytext = datadict.get("6_summary_description", "") or ""
-    
-    if len(summarytext) != 0 and summarytext != " ":
+    if row.summary:
         # summary edit: <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$0.$0.0.$displayPropKey2.$dcterms_description_0.1.0.0.0.2.1"> edit</span>
         #   CSS-selector: #edit-dcterms_description_0 > span:nth-child(2)
-        edit_summary = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#edit-dcterms_description_0 > span:nth-child(2)")))
+        edit_summary = wait_for_clickable(mydriver, wait_long, LOC_SUMMARY_EDIT, args.verbose)
         verbose_print("edit_summary found", args.verbose)
-        wait_for_obscuring_elements(mydriver, args.verbose)
         edit_summary.click()
         # summary form: The WYSIWYG editor is inside an iframe with class "wysihtml5-sandbox"
-        #   First, find and switch to the iframe
-        wysihtml5_iframe = WebDriverWait(mydriver, 100).until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe.wysihtml5-sandbox")))
-        mydriver.switch_to.frame(wysihtml5_iframe)
-        # Now find the body element inside the iframe
-        summary_form = WebDriverWait(mydriver, 100).until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-        # Click to focus the contenteditable element
-        summary_form.click()
-        sleep(0.3)
-        # Clear any existing content
-        summary_form.send_keys(Keys.CONTROL + "a")
-        sleep(0.2)
-        # Use JavaScript to set the text content (more reliable for contenteditable elements)
-        # Use the fixed summary text
-        mydriver.execute_script("arguments[0].textContent = arguments[1];", summary_form, summarytext)
-        # Trigger input event to ensure the editor recognizes the change
-        mydriver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", summary_form)
-        sleep(0.3)
-        # Switch back to default content before clicking save button (which is outside iframe)
-        mydriver.switch_to.default_content()
-        wait_for_obscuring_elements(mydriver, args.verbose)
+        #   it is written through the iframe's document, without switching the driver into the frame
+        wysihtml5_iframe = wait_long.until(EC.presence_of_element_located(LOC_WYSIWYG_IFRAME))
+        # Wait for the editor body inside the iframe, then focus, replace the content and
+        # fire the input event in one script call
+        wait_long.until(lambda d: d.execute_script(JS_WYSIWYG_TEXT, wysihtml5_iframe) is not None)
+        if not set_wysiwyg_text(mydriver, wysihtml5_iframe, row.summary):
+            row_warnings.append("Summary text could not be confirmed in the editor, please check it")
         # save: <i class="glyphicon glyphicon-ok"></i>
         #   .glyphicon-ok
-        save_summary_btn = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".glyphicon-ok")))
         wait_for_obscuring_elements(mydriver, args.verbose)
-        save_summary_btn.click()
+        finder.click(LOC_SAVE_CHECKMARK, timeout=100)
     else:
         warning_msg = "The summary is mandatory for the DataLumos project! Please fill it in manually."
         row_warnings.append(warning_msg)
@@ -782,21 +1478,14 @@ def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
 
     # --- Original Distribution url
 
-    original_url_text = datadict["7_original_distribution_url"]
-    if len(original_url_text) != 0 and original_url_text != " ":
+    if row.source_url:
         # edit: <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$0.$0.0.$displayPropKey4.$imeta_sourceURL_0.1.0.0.0.2.0.1"> edit</span>
         #   css-sel: #edit-imeta_sourceURL_0 > span:nth-child(1) > span:nth-child(2)
-        orig_distr_edit = WebDriverWait(mydriver, 100).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#edit-imeta_sourceURL_0 > span:nth-child(1) > span:nth-child(2)")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
-        orig_distr_edit.click()
         # form: <input type="text" class="form-control input-sm" style="padding-right: 24px;">
         #   css-sel.: .editable-input > input:nth-child(1)
-        orig_distr_form = WebDriverWait(mydriver, 100).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".editable-input > input:nth-child(1)")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
-        orig_distr_form.send_keys(original_url_text)
         # save: <button type="submit" class="btn btn-primary btn-sm editable-submit"><i class="glyphicon glyphicon-ok"></i> save</button>
         #   css-sel: .editable-submit
-        orig_distr_form.submit()
+        edit_inline_field(mydriver, wait_long, LOC_SOURCE_URL_EDIT, row.source_url, args.verbose)
 
 
     # --- Subject Terms / keywords
@@ -805,209 +1494,199 @@ def fill_project_forms(mydriver, datadict, args, row_errors, row_warnings):
     #   css-sel: .select2-search__field
     # scroll bar: <li class="select2-results__option select2-results__option--highlighted" role="treeitem" aria-selected="false">HIFLD Open</li>
     #    css-sel: .select2-results__option
-    keywordcells = [
-        datadict.get("8_subject_terms1", "") or "",
-        datadict.get("8_subject_terms2", "") or "",
-        datadict.get("8_keywords", "") or ""
-    ]
-    keywords_to_insert = []
-    for single_keywordcell in keywordcells:
-        if len(single_keywordcell) > 0 and single_keywordcell != " ":
-            more_keywords = single_keywordcell.replace("'", "").replace("[", "").replace("]", "").replace('"', '')  # remove quotes and brackets
-            more_keywordslist = more_keywords.split(",")
-            keywords_to_insert += more_keywordslist
+    keywords_to_insert = row.keywords
     verbose_print(f"\nkeywords_to_insert: {keywords_to_insert}\n", args.verbose)
-    for single_keyword in keywords_to_insert:
-        keyword = single_keyword.strip(" '")
-        if len(keyword) <= 2:
-            continue
+    wait_for_obscuring_elements(mydriver, args.verbose)
+    if keywords_to_insert:
+        # keywords that are options of the field are selected at once; the others are typed below,
+        #   and a keyword without a matching suggestion is reported
+        keywords_to_insert = insert_keywords_bulk(mydriver, keywords_to_insert)
+        verbose_print(f"✓ keywords selected via select2, left to enter one by one: {keywords_to_insert}", args.verbose)
+    for keyword in keywords_to_insert:
         try:
             wait_for_obscuring_elements(mydriver, args.verbose)
-            keywords_form = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".select2-search__field")))
+            keywords_form = finder.find(LOC_KEYWORDS, timeout=50)
             keywords_form.click()
             keywords_form.send_keys(keyword)
             #sleep(2)
-            wait_for_obscuring_elements(mydriver, args.verbose)
             #keyword_sugg = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".select2-results__option")))
             # find the list element, taking care to match the exact text [suggestion from user sefk]:
-            keyword_sugg = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.XPATH, f"//li[contains(@class, 'select2-results__option') and text()='{keyword}']")))
+            keyword_sugg = wait_med.until(lambda d: find_by_text(d, "li.select2-results__option", keyword))
             wait_for_obscuring_elements(mydriver, args.verbose)
             keyword_sugg.click()
-        except Exception as e:
+        except WebDriverException as e:
+            # a keyword without a matching suggestion times out here; other errors abort the row as before
             error_msg = f"Problem with keywords: {str(e)}"
             verbose_print(f"\n⚠ There was a problem with the keywords! Please check if one or more are missing in the form and fill them in manually.\n Problem:", args.verbose)
             print(f"\n⚠ {error_msg}")
-            print("\nFull traceback:")
-            print(traceback.format_exc())
+            if args.verbose:
+                print("\nFull traceback:")
+                print(traceback.format_exc())
             row_errors.append(error_msg)
 
 
     # --- Geographic Coverage
 
-    geographic_coverage_text = datadict["9_geographic_coverage"]
-    if len(geographic_coverage_text) != 0 and geographic_coverage_text != " ":
+    if row.geographic_coverage:
         # edit: <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$1.$1.0.$displayPropKey1.0.5:$dcterms_location_0_0.0.0.0.0.2.0.1"> edit</span>
         #   css-sel: #edit-dcterms_location_0 > span:nth-child(1) > span:nth-child(2)
-        geogr_cov_edit = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#edit-dcterms_location_0 > span:nth-child(1) > span:nth-child(2)")))
-        verbose_print("edit-button geogr_cov_form found", args.verbose)
-        wait_for_obscuring_elements(mydriver, args.verbose)
-        geogr_cov_edit.click()
         # form: <input type="text" class="form-control input-sm" style="padding-right: 24px;">
         #   .editable-input > input:nth-child(1)
-        geogr_cov_form = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".editable-input > input:nth-child(1)")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
-        geogr_cov_form.send_keys(geographic_coverage_text)
-        geogr_cov_form.submit()
+        edit_inline_field(mydriver, wait_med, LOC_GEOGRAPHIC_EDIT, row.geographic_coverage, args.verbose)
 
 
     # --- Time Period
 
-    timeperiod_start_text = datadict["10_time_period1"]
-    timeperiod_end_text = datadict["10_time_period2"]
-    if len(timeperiod_start_text) != 0 or len(timeperiod_end_text) != 0:
+    if row.has_time_period:
         # edit: <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$1.$1.0.$displayPropKey2.0.2.2"> add value</span>
         #   #groupAttr1 > div:nth-child(1) > div:nth-child(3) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)
-        time_period_add_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#groupAttr1 > div:nth-child(1) > div:nth-child(3) > div:nth-child(1) > a:nth-child(3) > span:nth-child(3)")))
+        time_period_add_btn = wait_for_clickable(mydriver, wait_med, LOC_TIME_PERIOD_ADD, args.verbose)
         verbose_print("time_period_add_btn found", args.verbose)
-        wait_for_obscuring_elements(mydriver, args.verbose)
         time_period_add_btn.click()
         # start: <input type="text" class="form-control" name="startDate" id="startDate" required="" placeholder="YYYY-MM-DD or YYYY-MM or YYYY" title="Enter as YYYY-MM-DD or YYYY-MM or YYYY" value="" data-reactid=".4.0.0.1.1.0.1.0">
         #   #startDate
-        time_period_start = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#startDate")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
-        time_period_start.send_keys(timeperiod_start_text)
+        time_period_start = wait_med.until(EC.presence_of_element_located(LOC_START_DATE))
         # <input type="text" class="form-control" name="endDate" id="endDate" placeholder="YYYY-MM-DD or YYYY-MM or YYYY" title="Enter as YYYY-MM-DD or YYYY-MM or YYYY" value="" data-reactid=".4.0.0.1.1.1.1.0">
         #   #endDate
-        time_period_end = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#endDate")))
+        time_period_end = wait_med.until(EC.presence_of_element_located(LOC_END_DATE))
         wait_for_obscuring_elements(mydriver, args.verbose)
-        time_period_end.send_keys(timeperiod_end_text)
+        # both dates in one script call
+        set_input_values(mydriver, [(time_period_start, row.time_period_start), (time_period_end, row.time_period_end)])
         # <button type="button" class="btn btn-primary save-dates" data-reactid=".4.0.0.1.1.3.0.0">Save &amp; Apply</button>
         #    .save-dates
-        save_time_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".save-dates")))
         wait_for_obscuring_elements(mydriver, args.verbose)
-        save_time_btn.click()
+        finder.click(LOC_SAVE_DATES, timeout=50)
 
 
     # --- Data types
 
-    datatype_to_select = datadict["11_data_types"]
-    if len(datatype_to_select) != 0 and datatype_to_select != " ":
+    if row.data_type:
         # <span data-reactid=".0.3.1.1.0.1.2.0.2.1:$0.$1.$1.0.$displayPropKey5.$disco_kindOfData_0.1.0.0.0.2.1"> edit</span>
         #   #disco_kindOfData_0 > span:nth-child(2)
-        datatypes_edit_btn = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#disco_kindOfData_0 > span:nth-child(2)")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
+        datatypes_edit_btn = wait_for_clickable(mydriver, wait_med, LOC_DATATYPES_EDIT, args.verbose)
         datatypes_edit_btn.click()
-        wait_for_obscuring_elements(mydriver, args.verbose)
         # <span> geographic information system (GIS) data</span>  # (there is a space character at the beginning of the string!)
         #   .editable-checklist > div:nth-child(8) > label:nth-child(1) > span:nth-child(2)
-        datatype_text = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.XPATH, f"//span[contains(text(), '{datatype_to_select}')]")))
+        datatype_text = wait_med.until(lambda d: find_by_text(d, ".editable-checklist label span", row.data_type, exact=False))
+        wait_for_obscuring_elements(mydriver, args.verbose)
         datatype_text.click()
         # <button type="submit" class="btn btn-primary btn-sm editable-submit"><i class="glyphicon glyphicon-ok"></i> save</button>
         #   .editable-submit
-        datatypes_save_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".editable-submit")))
-        datatypes_save_btn.click()
+        finder.click(LOC_EDITABLE_SUBMIT, timeout=50)
 
 
     # --- Collection Notes
 
-    if len(datadict["12_collection_notes"]) != 0 or len(datadict["12_download_date_original_source"]) != 0:
-        # check if there is data in the date field (otherwise set it to empty string):
-        downloaddate = f"(Downloaded {datadict['12_download_date_original_source']})" if len(datadict["12_download_date_original_source"]) != 0 else ""
-        # the text for collection notes is the note and the download date, if the note cell in the csv file isn't empty (otherwise it's only the date):
-        text_for_collectionnotes = datadict["12_collection_notes"] + " " + downloaddate if len(datadict["12_collection_notes"]) != 0 and datadict["12_collection_notes"] != " " else downloaddate
+    # the text for collection notes is the note and the download date (see RowData)
+    if row.collection_notes:
         # css-sel.: #edit-imeta_collectionNotes_0 > span:nth-child(2)
-        coll_notes_edit_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "#edit-imeta_collectionNotes_0 > span:nth-child(2)")))
-        wait_for_obscuring_elements(mydriver, args.verbose)
+        coll_notes_edit_btn = wait_for_clickable(mydriver, wait_med, LOC_COLLECTION_NOTES_EDIT, args.verbose)
         coll_notes_edit_btn.click()
         # The WYSIWYG editor is inside an iframe with class "wysihtml5-sandbox"
-        #   First, find and switch to the iframe
-        wysihtml5_iframe = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe.wysihtml5-sandbox")))
-        mydriver.switch_to.frame(wysihtml5_iframe)
-        # Now find the body element inside the iframe
-        coll_notes_form = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-        # Click to focus the contenteditable element
-        coll_notes_form.click()
-        sleep(0.3)
-        # Clear any existing content
-        coll_notes_form.send_keys(Keys.CONTROL + "a")
-        sleep(0.2)
-        # Use JavaScript to set the text content (more reliable for contenteditable elements)
-        mydriver.execute_script("arguments[0].textContent = arguments[1];", coll_notes_form, text_for_collectionnotes)
-        # Trigger input event to ensure the editor recognizes the change
-        mydriver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", coll_notes_form)
-        sleep(0.3)
-        # Switch back to default content before clicking save button (which is outside iframe)
-        mydriver.switch_to.default_content()
+        #   it is written through the iframe's document, without switching the driver into the frame
+        wysihtml5_iframe = wait_med.until(EC.presence_of_element_located(LOC_WYSIWYG_IFRAME))
+        # Wait for the editor body inside the iframe, then focus, replace the content and
+        # fire the input event in one script call
+        wait_med.until(lambda d: d.execute_script(JS_WYSIWYG_TEXT, wysihtml5_iframe) is not None)
+        if not set_wysiwyg_text(mydriver, wysihtml5_iframe, row.collection_notes):
+            row_warnings.append("Collection notes could not be confirmed in the editor, please check them")
         wait_for_obscuring_elements(mydriver, args.verbose)
         # css-sel: .editable-submit
-        coll_notes_save_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".editable-submit")))
-        coll_notes_save_btn.click()
+        finder.click(LOC_EDITABLE_SUBMIT, timeout=50)
 
 
     # --- Upload files
 
-    if len(datadict["path"]) != 0 and datadict["path"] != " ":
+    if row.path:
         # upload-button: <span data-reactid=".0.3.1.1.0.0.0.0.0.0.1.2.3">Upload Files</span>
-        #   a.btn-primary:nth-child(3) > span:nth-child(4)
+        #   located by the text of its link instead of the a.btn-primary:nth-child(3) > span:nth-child(4) position chain
         wait_for_obscuring_elements(mydriver, args.verbose)
-        upload_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, "a.btn-primary:nth-child(3) > span:nth-child(4)")))
+        upload_btn = wait_med.until(EC.element_to_be_clickable(LOC_UPLOAD_BTN))
         upload_btn.click()
         wait_for_obscuring_elements(mydriver, args.verbose)
-        fileupload_field = WebDriverWait(mydriver, 50).until(EC.presence_of_element_located((By.CSS_SELECTOR, ".col-md-offset-2 > span:nth-child(1)")))
+        fileupload_field = wait_med.until(EC.presence_of_element_located(LOC_FILE_DROP_AREA))
 
-        filepaths_to_upload = get_paths_uploadfiles(args.folder_path_uploadfiles, datadict["path"])
-        if len(filepaths_to_upload) != 2:
-            warning_msg = f"The number of files to upload is not 2: {len(filepaths_to_upload)} workspace id {workspace_id}"
-            verbose_print(f"⚠ {warning_msg}", args.verbose)
-            return
-        verbose_print(f"\nFiles that will be uploaded: {[os.path.basename(f) for f in filepaths_to_upload]}\n", args.verbose)
-        for singlefile in filepaths_to_upload:
-            try:
-                drag_and_drop_file(fileupload_field, singlefile)
-            except Exception as e:
-                error_msg = f"Error uploading file '{os.path.basename(singlefile)}': {str(e)}"
-                verbose_print(f"⚠ {error_msg}", args.verbose)
-                print(f"⚠ {error_msg}")
-                print(f"Full path: {singlefile}")
-                print("\nFull traceback:")
-                print(traceback.format_exc())
-                row_errors.append(error_msg)
-                raise  # Re-raise to stop processing
+        # the files were checked at the start of the row
+        verbose_print(f"\nFiles that will be uploaded: {filenames_to_upload}\n", args.verbose)
+        try:
+            drag_and_drop_files(fileupload_field, filepaths_to_upload)
+        except Exception as e:
+            error_msg = f"Error uploading files {filenames_to_upload}: {str(e)}"
+            verbose_print(f"⚠ {error_msg}", args.verbose)
+            print(f"⚠ {error_msg}")
+            print(f"Full paths: {filepaths_to_upload}")
+            print("\nFull traceback:")
+            print(traceback.format_exc())
+            row_errors.append(error_msg)
+            raise  # Re-raise to stop processing
 
         # when a file is uploaded and its progress bar is complete, a text appears: "File added to queue for upload."
         #   To check that the files are completey uploaded, this text has to be there as often as the number of files:
         filecount = len(filepaths_to_upload)
         verbose_print(f"filecount: {filecount}", args.verbose)
         # wait until the text has appeared as often as there are files:
-        #   (to wait longer for uploads to be completed, change the number in WebDriverWait(mydriver, ...) - it is the waiting time in seconds)
-        WebDriverWait(mydriver, 2000).until(lambda x: True if len(mydriver.find_elements(By.XPATH, "//span[text()='File added to queue for upload.']")) == filecount else False)
+        #   (to wait longer for uploads to be completed, change the number in wait_for_dom_condition(...) - it is the waiting time in seconds)
+        #   (the messages are counted inside the browser whenever the dialog changes; ">=" so a leftover
+        #   message from an earlier upload can't make the wait run into its timeout)
+        wait_for_dom_condition(mydriver, JS_UPLOADED_FILES_COMPLETE, 2000, filecount)
         verbose_print("\nEverything should be uploaded completely now.\n", args.verbose)
 
 
         # close-btn: .importFileModal > div:nth-child(3) > button:nth-child(1)
         wait_for_obscuring_elements(mydriver, args.verbose)
-        close_btn = WebDriverWait(mydriver, 50).until(EC.element_to_be_clickable((By.CSS_SELECTOR, ".importFileModal > div:nth-child(3) > button:nth-child(1)")))
-        close_btn.click()
+        finder.click(LOC_CLOSE_UPLOAD, timeout=50)
         
     return workspace_id
 
 
+def _column_letter(col_index):
+    # 1-based column index to letters; each divmod step yields one letter, least significant first
+    letters = []
+    while col_index > 0:
+        col_index, remainder = divmod(col_index - 1, 26)
+        letters.append(chr(65 + remainder))
+    return "".join(reversed(letters))
+
+# Letters of the first 1024 columns (index 0 is column 1 -> 'A'), computed once
+COLUMN_LETTERS = [_column_letter(col_index) for col_index in range(1, 1025)]
+# The reverse lookup: column letters to 1-based column indexes
+COLUMN_INDEXES = {col_letter: col_index for col_index, col_letter in enumerate(COLUMN_LETTERS, start=1)}
+
 def column_index_to_letter(col_index):
     """
     Convert a 1-based column index to a column letter (e.g., 1 -> A, 2 -> B, 27 -> AA).
     
+    Looked up in COLUMN_LETTERS; only columns beyond it are computed.
+    
     Args:
         col_index: 1-based column index
     
     Returns:
         Column letter (e.g., 'A', 'B', 'AA')
     """
-    result = ""
-    while col_index > 0:
-        col_index -= 1
-        result = chr(65 + (col_index % 26)) + result
-        col_index //= 26
-    return result
+    if 0 < col_index <= len(COLUMN_LETTERS):
+        return COLUMN_LETTERS[col_index - 1]
+    return _column_letter(col_index)
+
+
+def column_letter_to_index(col_letter):
+    """
+    Convert a column letter to a 1-based column index (e.g., A -> 1, B -> 2, AA -> 27).
+    
+    Looked up in COLUMN_INDEXES; only columns beyond it are computed.
+    
+    Args:
+        col_letter: Column letter (e.g., 'A', 'B', 'AA')
+    
+    Returns:
+        1-based column index
+    """
+    if col_letter in COLUMN_INDEXES:
+        return COLUMN_INDEXES[col_letter]
+    col_index = 0
+    for letter in col_letter:
+        col_index = col_index * 26 + ord(letter) - 64
+    return col_index
 
 
 def get_column_mapping(service, sheet_id, sheet_name, required_columns, verbose=False):
@@ -1023,7 +1702,10 @@ def get_column_mapping(service, sheet_id, sheet_name, required_columns, verbose=
     
     Returns:
         Dictionary mapping column names to column letters (e.g., {'URL': 'G', 'Claimed': 'B'})
-        Returns None if a required column is missing
+        Returns None if the header row could not be read
+    
+    Raises:
+        SheetColumnsMissingError: If a required column is missing
     """
     try:
         # Read the first row (header row)
@@ -1031,7 +1713,7 @@ def get_column_mapping(service, sheet_id, sheet_name, required_columns, verbose=
         result = service.spreadsheets().values().get(
             spreadsheetId=sheet_id,
             range=range_name
-        ).execute()
+        ).execute(num_retries=SHEETS_API_RETRIES)
         
         values = result.get('values', [])
         if not values or len(values) == 0:
@@ -1079,19 +1761,148 @@ def get_column_mapping(service, sheet_id, sheet_name, required_columns, verbose=
             for col_name, col_letter in sorted(column_map.items()):
                 error_msg += f"   - {col_name} ({col_letter})\n"
             print(error_msg)
-            raise ValueError(f"Required columns missing from Google Sheet '{sheet_name}'. See error message above.")
+            raise SheetColumnsMissingError(f"Required columns missing from Google Sheet '{sheet_name}'. See error message above.")
         
         return found_columns
         
+    except SheetColumnsMissingError:
+        raise
     except Exception as e:
         print(f"✗ ERROR: Failed to read column headers from Google Sheet: {str(e)}")
         return None
 
 
+# Column mappings already read from the Google Sheets' header rows, by (sheet_id, sheet_name);
+#   filled by check_sheet_columns() before the workers start, then only used by the single
+#   background thread that updates the sheet
+column_maps = {}
+
+# Columns the Google Sheet must have for the publishing results (found by name in the header row)
+SHEET_REQUIRED_COLUMNS = [
+    'URL',  # Column to match source_url against
+    'Claimed',  # or "Claimed (add your name)"
+    'Data Added',  # or "Data Added (Y/N/IP)"
+    'Dataset Download Possible?',
+    'Nominated to EOT / USGWDA',  # or "Nominated"
+    'Date Downloaded',
+    'Download Location',
+    'Dataset Size',
+    'File extensions of data uploads',  # or "File extensions"
+    'Metadata availability info'  # or "Metadata"
+]
+
+def get_sheet_column_map(service, sheet_id, sheet_name, verbose=False):
+    """
+    Return the column mapping of a Google Sheet, reading its header row only once per run.
+    
+    Args:
+        service: Google Sheets API service object
+        sheet_id: Google Sheet ID
+        sheet_name: Name of the worksheet/tab
+        verbose: Whether to print verbose messages
+    
+    Returns:
+        Dictionary mapping the SHEET_REQUIRED_COLUMNS to column letters, or None if the header
+        row could not be read (it is read again by the next call)
+    
+    Raises:
+        SheetColumnsMissingError: If a required column is missing
+    """
+    column_map = column_maps.get((sheet_id, sheet_name))
+    if column_map is None:
+        verbose_print(f"  Reading column headers from sheet '{sheet_name}'...", verbose)
+        column_map = get_column_mapping(service, sheet_id, sheet_name, SHEET_REQUIRED_COLUMNS, verbose)
+        if column_map:
+            column_maps[(sheet_id, sheet_name)] = column_map
+    return column_map
+
+
+def check_sheet_columns(args):
+    """
+    Check the Google Sheet's header row once, before anything is published.
+    
+    The sheet updates run in the background after each batch; checking the columns first
+    stops a run against a sheet without the required columns before its first row, instead of
+    after a whole batch has been published. A header row that can't be read (e.g. a network
+    problem) is only reported: the updates read it again.
+    
+    Args:
+        args: Parsed command-line arguments
+    
+    Returns:
+        bool: False if required columns are missing (the run should stop), True otherwise
+    """
+    if not (args.google_sheet_id and args.google_credentials) or args.publish_mode == 'no-publish' \
+            or not GOOGLE_SHEETS_AVAILABLE:
+        return True
+    print("Checking Google Sheet columns...")
+    try:
+        service = get_sheets_service(args.google_credentials)
+        if get_sheet_column_map(service, args.google_sheet_id, args.google_sheet_name, args.verbose):
+            print(f"✓ Google Sheet '{args.google_sheet_name}' has all required columns\n")
+        else:
+            print("⚠ Could not read the Google Sheet's header row; it is read again with the first update\n")
+    except SheetColumnsMissingError as e:
+        print(f"✗ {str(e)}")
+        return False
+    except Exception as e:
+        print(f"⚠ Could not check the Google Sheet columns: {str(e)}; they are checked again with the first update\n")
+    return True
+
+# URL columns already read from the Google Sheets, by (sheet_id, sheet_name, column letter);
+#   only used by the single background thread that updates the sheet
+url_indexes = {}
+
+def build_url_index(service, sheet_id, sheet_name, url_column_letter):
+    """
+    Read the URL column of a Google Sheet once, for looking up rows by URL.
+    
+    Args:
+        service: Google Sheets API service object
+        sheet_id: Google Sheet ID
+        sheet_name: Name of the worksheet/tab
+        url_column_letter: Column letter containing URLs (e.g., "G")
+    
+    Returns:
+        Tuple of (dict from cleaned URL to its first row number, list of (cleaned URL, row number)
+        in sheet order); URLs are cleaned by stripping whitespace and lowercasing, empty cells are left out
+    """
+    # Read all values from the URL column (starting from row 2 to skip header)
+    range_name = f"{sheet_name}!{url_column_letter}2:{url_column_letter}"
+    result = service.spreadsheets().values().get(
+        spreadsheetId=sheet_id,
+        range=range_name
+    ).execute(num_retries=SHEETS_API_RETRIES)
+    
+    exact_rows = {}
+    cell_rows = []
+    for idx, row in enumerate(result.get('values', [])):
+        cell_url = str(row[0]).strip().lower() if row else ""
+        if cell_url:
+            # Row number is idx + 2 (idx is 0-based, +1 for header, +1 for 1-indexing)
+            exact_rows.setdefault(cell_url, idx + 2)
+            cell_rows.append((cell_url, idx + 2))
+    return exact_rows, cell_rows
+
+
+def _match_url(url_index, source_url_clean):
+    # exact match first, then the first row whose URL contains or is contained in the source URL
+    exact_rows, cell_rows = url_index
+    if source_url_clean in exact_rows:
+        return exact_rows[source_url_clean]
+    for cell_url, row_num in cell_rows:
+        if source_url_clean in cell_url or cell_url in source_url_clean:
+            return row_num
+    return None
+
+
 def find_row_by_url(service, sheet_id, sheet_name, url_column_letter, source_url, verbose=False):
     """
     Find the row number in Google Sheet by matching URL in the specified column.
     
+    The column is read once (see build_url_index()) and reused for later rows; it is read
+    again only when a URL isn't found, in case its row was added to the sheet meanwhile.
+    
     Args:
         service: Google Sheets API service object
         sheet_id: Google Sheet ID
@@ -1104,230 +1915,313 @@ def find_row_by_url(service, sheet_id, sheet_name, url_column_letter, source_url
         Row number (1-indexed) if found, None otherwise
     """
     try:
-        # Read all values from the URL column (starting from row 2 to skip header)
-        range_name = f"{sheet_name}!{url_column_letter}2:{url_column_letter}"
-        result = service.spreadsheets().values().get(
-            spreadsheetId=sheet_id,
-            range=range_name
-        ).execute()
-        
-        values = result.get('values', [])
-        
+        key = (sheet_id, sheet_name, url_column_letter)
         # Search for matching URL (case-insensitive, handle partial matches)
         source_url_clean = source_url.strip().lower()
-        for idx, row in enumerate(values):
-            if row and len(row) > 0:
-                cell_url = str(row[0]).strip().lower()
-                # Check for exact match or if source_url is contained in cell_url
-                if source_url_clean == cell_url or source_url_clean in cell_url or cell_url in source_url_clean:
-                    # Row number is idx + 2 (idx is 0-based, +1 for header, +1 for 1-indexing)
-                    row_num = idx + 2
-                    verbose_print(f"  Found matching URL in row {row_num}: {row[0]}", verbose)
-                    return row_num
-        
-        return None
+        url_index = url_indexes.get(key)
+        read_now = url_index is None
+        if read_now:
+            url_index = url_indexes[key] = build_url_index(service, sheet_id, sheet_name, url_column_letter)
+        row_num = _match_url(url_index, source_url_clean)
+        if row_num is None and not read_now:
+            # the row may have been added to the sheet since the column was read
+            url_index = url_indexes[key] = build_url_index(service, sheet_id, sheet_name, url_column_letter)
+            row_num = _match_url(url_index, source_url_clean)
+        if row_num is not None:
+            verbose_print(f"  Found matching URL in row {row_num}", verbose)
+        return row_num
         
     except Exception as e:
         verbose_print(f"  Error searching for URL: {str(e)}", verbose)
         return None
 
 
-def update_google_sheet(sheet_id, credentials_path, sheet_name, source_url, workspace_id, datadict, username='mkraley', verbose=False):
+# Times a Sheets API request is repeated after a rate limit (429) or server error (5xx) response;
+#   the client library waits with exponential backoff and random jitter in between
+SHEETS_API_RETRIES = 4
+
+# Google Sheets API clients of the current thread, by credentials path
+#   (a client's HTTP connection must not be shared between worker threads)
+sheets_services = threading.local()
+
+def get_sheets_service(credentials_path):
     """
-    Update a Google Sheet with publishing results by finding row via URL match.
-    Uses column names from the first row instead of fixed column positions.
+    Return a Google Sheets API client for the service account, building it only once per thread.
+    
+    Building the client authenticates and sets up the API from its discovery document; reusing
+    it saves that work and the connection setup for every row after the first.
     
     Args:
-        sheet_id: Google Sheet ID (from URL)
         credentials_path: Path to service account credentials JSON file
+    
+    Returns:
+        Google Sheets API service object
+    """
+    if not hasattr(sheets_services, 'by_path'):
+        sheets_services.by_path = {}
+    services = sheets_services.by_path
+    if credentials_path not in services:
+        # Authenticate using service account
+        credentials = service_account.Credentials.from_service_account_file(
+            credentials_path,
+            scopes=['https://www.googleapis.com/auth/spreadsheets']
+        )
+        # the discovery document ships with the library; skip the (unavailable) file cache and its warning
+        services[credentials_path] = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+    return services[credentials_path]
+
+
+# Sheet columns written for a published row: (column name, CSV column the value is taken from, fixed value);
+#   the "Claimed" and "Download Location" values depend on the run and are added by sheet_row_values()
+SHEET_ROW_FIELDS = (
+    ('Data Added', None, 'Y'),
+    ('Dataset Download Possible?', None, 'Y'),
+    ('Nominated to EOT / USGWDA', None, 'Y'),
+    ('Date Downloaded', "12_download_date_original_source", None),
+    ('Dataset Size', "dataset_size", None),
+    ('File extensions of data uploads', "file_extensions", None),
+    ('Metadata availability info', None, 'Y'),
+)
+
+def sheet_row_values(workspace_id, datadict, username):
+    """
+    Return the values to write into the Google Sheet for a published row.
+    
+    Args:
+        workspace_id: Workspace ID for creating download location URL (may be None)
+        datadict: Dictionary containing CSV row data
+        username: Username to write in "Claimed" column
+    
+    Returns:
+        List of (column name, value) pairs; empty values mean the cell is left unchanged
+    """
+    values = [('Claimed', username)]
+    for column_name, csv_column, fixed_value in SHEET_ROW_FIELDS:
+        values.append((column_name, fixed_value if csv_column is None else (datadict.get(csv_column) or "").strip()))
+    if workspace_id:
+        values.append(('Download Location', f"https://www.datalumos.org/datalumos/project/{workspace_id}/version/V1/view"))
+    return values
+
+
+def build_sheet_row_update(sheet_name, row_number, column_map, workspace_id, datadict, username):
+    """
+    Build the value range that writes the publishing results of one row into the Google Sheet.
+    
+    Args:
         sheet_name: Name of the worksheet/tab
-        source_url: Source URL to match against URL column
+        row_number: Row number in the sheet (1-indexed, header is row 1)
+        column_map: Column names mapped to column letters, as returned by get_column_mapping()
         workspace_id: Workspace ID for creating download location URL
         datadict: Dictionary containing CSV row data
+        username: Username to write in "Claimed" column
+    
+    Returns:
+        Value range dictionary ({'range': ..., 'values': ...}) for values().batchUpdate,
+        or None if there is nothing to write
+    """
+    # Collect the new cell values, by column letter
+    updates = {}
+    for column_name, value in sheet_row_values(workspace_id, datadict, username):
+        col_letter = column_map.get(column_name)
+        if col_letter and value:
+            updates[col_letter] = value
+    
+    if not updates:
+        return None
+    
+    # Write one range from the first to the last updated column; the cells in between are
+    #   sent as None (null), which the Sheets API skips, so they keep their contents
+    values_by_index = {column_letter_to_index(col): value for col, value in updates.items()}
+    first_col, last_col = min(values_by_index), max(values_by_index)
+    row_values = [values_by_index.get(col_index) for col_index in range(first_col, last_col + 1)]
+    range_name = f"{sheet_name}!{column_index_to_letter(first_col)}{row_number}:{column_index_to_letter(last_col)}{row_number}"
+    return {'range': range_name, 'values': [row_values]}
+
+
+def update_google_sheet_rows(sheet_id, credentials_path, sheet_name, rows, username='mkraley', verbose=False):
+    """
+    Update several rows of a Google Sheet with publishing results in one batchUpdate call.
+    Each row is found by matching its source URL; columns are found by the names in the
+    first row instead of fixed column positions.
+    
+    Args:
+        sheet_id: Google Sheet ID (from URL)
+        credentials_path: Path to service account credentials JSON file
+        sheet_name: Name of the worksheet/tab
+        rows: List of (source_url, workspace_id, datadict) tuples, one per row to update
         username: Username to write in "Claimed" column (default: 'mkraley')
         verbose: Whether to print verbose messages
     
     Returns:
-        Tuple of (success: bool, error_message: str or None)
+        List of (success: bool, error_message: str or None) tuples, in the order of rows
+    
+    Raises:
+        SheetColumnsMissingError: If a required column is missing from the sheet
     """
     if not GOOGLE_SHEETS_AVAILABLE:
-        return False, "Google Sheets API libraries not installed. Install with: pip install google-api-python-client google-auth google-auth-httplib2"
+        return [(False, "Google Sheets API libraries not installed. Install with: pip install google-api-python-client google-auth google-auth-httplib2")] * len(rows)
     
     if not sheet_id or not credentials_path:
-        return False, "Google Sheet ID and credentials path are required"
-    
-    if not source_url:
-        return False, "Source URL is required to find matching row"
+        return [(False, "Google Sheet ID and credentials path are required")] * len(rows)
     
+    results = [None] * len(rows)
+    value_ranges = []
+    written_rows = []
     try:
-        # Authenticate using service account
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        service = build('sheets', 'v4', credentials=credentials)
-        
-        # Define required columns with their search names
-        required_columns = [
-            'URL',  # Column to match source_url against
-            'Claimed',  # or "Claimed (add your name)"
-            'Data Added',  # or "Data Added (Y/N/IP)"
-            'Dataset Download Possible?',
-            'Nominated to EOT / USGWDA',  # or "Nominated"
-            'Date Downloaded',
-            'Download Location',
-            'Dataset Size',
-            'File extensions of data uploads',  # or "File extensions"
-            'Metadata availability info'  # or "Metadata"
-        ]
-        
-        # Get column mapping from sheet headers
-        verbose_print(f"  Reading column headers from sheet '{sheet_name}'...", verbose)
-        column_map = get_column_mapping(service, sheet_id, sheet_name, required_columns, verbose)
+        service = get_sheets_service(credentials_path)
         
+        # Get column mapping from sheet headers (read once per sheet and run)
+        column_map = get_sheet_column_map(service, sheet_id, sheet_name, verbose)
         if not column_map:
             error_msg = "Failed to get column mapping from Google Sheet. Check column names."
             print(f"\n✗ {error_msg}")
-            return False, error_msg
+            return [(False, error_msg)] * len(rows)
         
-        # Find row by matching URL
         url_col_letter = column_map.get('URL')
         if not url_col_letter:
             error_msg = "Could not find URL column in sheet"
             print(f"\n✗ {error_msg}")
-            return False, error_msg
-        
-        verbose_print(f"  Searching for URL in column {url_col_letter}: {source_url}", verbose)
-        row_number = find_row_by_url(service, sheet_id, sheet_name, url_col_letter, source_url, verbose)
-        
-        if not row_number:
-            error_msg = f"Could not find row with matching URL: {source_url}"
-            verbose_print(f"  ⚠ {error_msg}", verbose)
-            return False, error_msg
-        
-        verbose_print(f"  Found matching row: {row_number}", verbose)
-        
-        # Prepare update requests for all columns
-        update_requests = []
-        
-        # Claimed (add your name)
-        claimed_col = column_map.get('Claimed')
-        if claimed_col:
-            update_requests.append({
-                'range': f"{sheet_name}!{claimed_col}{row_number}",
-                'values': [[username]]
-            })
-        
-        # Data Added (Y/N/IP)
-        data_added_col = column_map.get('Data Added')
-        if data_added_col:
-            update_requests.append({
-                'range': f"{sheet_name}!{data_added_col}{row_number}",
-                'values': [['Y']]
-            })
-        
-        # Dataset Download Possible?
-        download_possible_col = column_map.get('Dataset Download Possible?')
-        if download_possible_col:
-            update_requests.append({
-                'range': f"{sheet_name}!{download_possible_col}{row_number}",
-                'values': [['Y']]
-            })
-        
-        # Nominated to EOT / USGWDA
-        nominated_col = column_map.get('Nominated to EOT / USGWDA')
-        if nominated_col:
-            update_requests.append({
-                'range': f"{sheet_name}!{nominated_col}{row_number}",
-                'values': [['Y']]
-            })
-        
-        # Date Downloaded
-        date_downloaded_col = column_map.get('Date Downloaded')
-        if date_downloaded_col:
-            download_date = datadict.get("12_download_date_original_source", "").strip()
-            if download_date:
-                update_requests.append({
-                    'range': f"{sheet_name}!{date_downloaded_col}{row_number}",
-                    'values': [[download_date]]
-                })
-        
-        # Download Location
-        download_location_col = column_map.get('Download Location')
-        if download_location_col and workspace_id:
-            download_location = f"https://www.datalumos.org/datalumos/project/{workspace_id}/version/V1/view"
-            update_requests.append({
-                'range': f"{sheet_name}!{download_location_col}{row_number}",
-                'values': [[download_location]]
-            })
-        
-        # Dataset Size
-        dataset_size_col = column_map.get('Dataset Size')
-        if dataset_size_col:
-            dataset_size = datadict.get("dataset_size", "").strip()
-            if dataset_size:
-                update_requests.append({
-                    'range': f"{sheet_name}!{dataset_size_col}{row_number}",
-                    'values': [[dataset_size]]
-                })
-        
-        # File extensions of data uploads
-        file_extensions_col = column_map.get('File extensions of data uploads')
-        if file_extensions_col:
-            file_extensions = datadict.get("file_extensions", "").strip()
-            if file_extensions:
-                update_requests.append({
-                    'range': f"{sheet_name}!{file_extensions_col}{row_number}",
-                    'values': [[file_extensions]]
-                })
-        
-        # Metadata availability info
-        metadata_col = column_map.get('Metadata availability info')
-        if metadata_col:
-            update_requests.append({
-                'range': f"{sheet_name}!{metadata_col}{row_number}",
-                'values': [['Y']]
-            })
-        
-        if not update_requests:
-            return False, "No data to update"
+            return [(False, error_msg)] * len(rows)
         
-        # Batch update
-        body = {
-            'valueInputOption': 'USER_ENTERED',
-            'data': update_requests
-        }
-        
-        result = service.spreadsheets().values().batchUpdate(
-            spreadsheetId=sheet_id,
-            body=body
-        ).execute()
-        
-        verbose_print(f"✓ Successfully updated Google Sheet row {row_number} with {len(update_requests)} columns", verbose)
-        return True, None
-        
-    except ValueError:
-        # Re-raise ValueError (missing columns) to stop execution
+        for index, (source_url, workspace_id, datadict) in enumerate(rows):
+            if not source_url:
+                results[index] = (False, "Source URL is required to find matching row")
+                continue
+            
+            # Find row by matching URL
+            verbose_print(f"  Searching for URL in column {url_col_letter}: {source_url}", verbose)
+            row_number = find_row_by_url(service, sheet_id, sheet_name, url_col_letter, source_url, verbose)
+            if not row_number:
+                error_msg = f"Could not find row with matching URL: {source_url}"
+                verbose_print(f"  ⚠ {error_msg}", verbose)
+                results[index] = (False, error_msg)
+                continue
+            verbose_print(f"  Found matching row: {row_number}", verbose)
+            
+            value_range = build_sheet_row_update(sheet_name, row_number, column_map, workspace_id, datadict, username)
+            if value_range is None:
+                results[index] = (False, "No data to update")
+                continue
+            value_ranges.append(value_range)
+            written_rows.append(index)
+        
+        if value_ranges:
+            # All rows in one batch update
+            body = {
+                'valueInputOption': 'USER_ENTERED',
+                'data': value_ranges
+            }
+            service.spreadsheets().values().batchUpdate(
+                spreadsheetId=sheet_id,
+                body=body
+            ).execute(num_retries=SHEETS_API_RETRIES)
+            for index in written_rows:
+                results[index] = (True, None)
+            verbose_print(f"✓ Successfully updated {len(value_ranges)} Google Sheet row(s)", verbose)
+        return results
+        
+    except SheetColumnsMissingError:
+        # Re-raise (missing columns) to stop execution
         raise
     except FileNotFoundError:
         error_msg = f"Credentials file not found: {credentials_path}"
         verbose_print(f"⚠ {error_msg}", verbose)
-        return False, error_msg
     except HttpError as e:
         error_msg = f"Google Sheets API error: {str(e)}"
         verbose_print(f"⚠ {error_msg}", verbose)
-        return False, error_msg
     except Exception as e:
         error_msg = f"Error updating Google Sheet: {str(e)}"
         verbose_print(f"⚠ {error_msg}", verbose)
         verbose_print(traceback.format_exc(), verbose)
-        return False, error_msg
+    # Rows that failed on their own keep their message; all others failed with the error above
+    return [result if result and not result[0] else (False, error_msg) for result in results]
+
+
+def wait_for_button(driver, text, timeout=50):
+    """
+    Wait for an enabled primary button of the publishing workflow, found by its text.
+    
+    The buttons are matched by find_by_text() in the browser, one script call per poll,
+    instead of an XPath text search followed by the displayed/enabled checks.
+    
+    Args:
+        driver: WebDriver instance
+        text: Text the button contains (e.g. "Publish Project")
+        timeout: Seconds to wait (default: 50)
+    
+    Returns:
+        The button WebElement
+    
+    Raises:
+        TimeoutException: If no such button is shown within the timeout
+    """
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+        lambda d: find_by_text(d, PUBLISH_BUTTON_SELECTOR, text, exact=False)
+    )
+
+
+# Errors of a single publish step that are worth repeating the step for (overlays, re-rendered
+#   buttons), and how often a step is tried; a TimeoutException is not repeated, since the step's
+#   wait has already given the page its full timeout
+TRANSIENT_STEP_ERRORS = (StaleElementReferenceException, ElementClickInterceptedException)
+STEP_TRIES = 3
+
+def retry_step(step, tries=STEP_TRIES, base_delay=0.5):
+    """
+    Run one step of a browser workflow, repeating it after transient errors.
+    
+    Waits base_delay, 2 * base_delay, ... (plus up to 0.1 s of random jitter) between the tries.
+    
+    Args:
+        step: Function without arguments that performs the step
+        tries: How often the step is tried (default: STEP_TRIES)
+        base_delay: Seconds to wait before the first repetition (default: 0.5)
+    
+    Returns:
+        The return value of step()
+    
+    Raises:
+        The last exception, if the step failed in every try; other errors than
+        TRANSIENT_STEP_ERRORS are raised at once
+    """
+    for attempt in range(tries):
+        try:
+            return step()
+        except TRANSIENT_STEP_ERRORS:
+            if attempt == tries - 1:
+                raise
+            sleep(base_delay * 2 ** attempt + random.uniform(0, 0.1))
+
+
+def check_publish_error(mydriver, current_row):
+    """
+    Raise BatchRestartException if DataLumos shows an error message.
+    
+    Args:
+        mydriver: WebDriver instance
+        current_row: Current row number being processed (for error messages)
+    
+    Raises:
+        BatchRestartException: If the error message div has text
+    """
+    error_msg_divs = mydriver.find_elements(*LOC_ERROR_MSG)
+    if len(error_msg_divs) > 0:
+        error_msg_div = error_msg_divs[0]
+        if len(error_msg_div.text) > 0:
+            error_text = error_msg_div.text
+            row_info = f"Row {current_row}: " if current_row else ""
+            error_message = f"{row_info}Error message detected: {error_text}"
+            print(f"✗ {error_message}")
+            raise BatchRestartException(error_message, None)
 
 
 def publish_workspace(mydriver, current_row=None, verbose=False):
     """
     Execute the publishing workflow for a workspace.
     
+    Each step is repeated on its own after a transient error (see retry_step()), so the steps
+    that already succeeded are not done again.
+    
     Args:
         mydriver: WebDriver instance
         current_row: Current row number being processed (for error messages)
@@ -1338,150 +2232,146 @@ def publish_workspace(mydriver, current_row=None, verbose=False):
     """
     verbose_print("\nStarting publish workflow...", verbose)
     
-    # Attempt publishing with retry logic (one retry after 5 seconds if error occurs)
-    for attempt in range(2):  # Try twice: original attempt + one retry
-        if attempt > 0:
-            row_info = f"Row {current_row}: " if current_row else ""
-            print(f"{row_info}Publish workflow failed, waiting 5 seconds before retry...", verbose)
-            sleep(5)
-            print(f"{row_info}Retrying publish workflow...", verbose)
+    def click_button(text):
+        button = wait_for_button(mydriver, text)
+        verbose_print(f"Found '{text}' button", verbose)
+        wait_for_obscuring_elements(mydriver, verbose)
+        button.click()
+    
+    def select_publish_options():
+        # Radio button: <input type="radio" name="disclosure" id="noDisclosure" ...>
+        # Radio button: <input type="radio" name="sensitive" id="sensitiveNo" ...>
+        # Checkbox: <input type="checkbox" id="depositAgree" ...>
+        #   the three are in the same dialog: wait for the last one, then click them in one script call
+        WebDriverWait(mydriver, 50).until(
+            EC.element_to_be_clickable(LOC_DEPOSIT_AGREE)
+        )
+        verbose_print("Found 'depositAgree' checkbox", verbose)
+        wait_for_obscuring_elements(mydriver, verbose)
+        check_inputs(mydriver, [LOC_NO_DISCLOSURE, LOC_SENSITIVE_NO, LOC_DEPOSIT_AGREE])
+        verbose_print("Selected 'noDisclosure', 'sensitiveNo' and 'depositAgree'", verbose)
+    
+    try:
+        # Step 1: Click "Publish Project" button
+        # <button type="submit" class="btn btn-primary btn-sm" ...>Publish Project</button>
+        retry_step(lambda: click_button("Publish Project"))
         
+        # Wait for navigation to review/publish page
         try:
-            # Step 1: Click "Publish Project" button
-            # <button type="submit" class="btn btn-primary btn-sm" ...>Publish Project</button>
-            publish_project_btn = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., 'Publish Project')]"))
-            )
-            verbose_print("Found 'Publish Project' button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            publish_project_btn.click()
-            
-            # Wait for navigation to review/publish page
-            try:
-                WebDriverWait(mydriver, 30).until(
-                    lambda d: 'reviewPublish' in d.current_url
-                )
-                verbose_print(f"Navigated to review/publish page: {mydriver.current_url}", verbose)
-                sleep(1)
-            except TimeoutException:
-                # If timeout waiting for reviewPublish, check for error message (same logic as line 1404)
-                verbose_print("Timeout waiting for reviewPublish page, checking for error message...", verbose)
-                error_msg_divs = mydriver.find_elements(By.ID, 'errormsg')
-                if len(error_msg_divs) > 0:
-                    error_msg_div = error_msg_divs[0]
-                    if len(error_msg_div.text) > 0:
-                        error_text = error_msg_div.text
-                        row_info = f"Row {current_row}: " if current_row else ""
-                        error_message = f"{row_info}Error message detected: {error_text}"
-                        print(f"✗ {error_message}")
-                        raise BatchRestartException(error_message, None)
-                # If no error message found, re-raise the timeout exception
-                raise
-            
-            # Step 2: Click "Proceed to Publish" button
-            # <button type="submit" class="btn btn-primary btn-sm" ...>Proceed to Publish</button>
-            proceed_publish_btn = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., 'Proceed to Publish')]"))
-            )
-            verbose_print("Found 'Proceed to Publish' button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            proceed_publish_btn.click()
-            sleep(1)
-            
-            # Step 3: In the dialog, select options
-            # Radio button: <input type="radio" name="disclosure" id="noDisclosure" ...>
-            no_disclosure_radio = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.ID, "noDisclosure"))
-            )
-            verbose_print("Found 'noDisclosure' radio button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            no_disclosure_radio.click()
-            sleep(0.5)
-            
-            # Radio button: <input type="radio" name="sensitive" id="sensitiveNo" ...>
-            sensitive_no_radio = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.ID, "sensitiveNo"))
-            )
-            verbose_print("Found 'sensitiveNo' radio button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            sensitive_no_radio.click()
-            sleep(0.5)
-            
-            # Checkbox: <input type="checkbox" id="depositAgree" ...>
-            deposit_agree_checkbox = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.ID, "depositAgree"))
-            )
-            verbose_print("Found 'depositAgree' checkbox", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            deposit_agree_checkbox.click()
-            sleep(0.5)
-            
-            # Step 4: Click "Publish Data" button
-            # <button type="button" class="btn btn-primary" ...>Publish Data</button>
-            publish_data_btn = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., 'Publish Data')]"))
-            )
-            verbose_print("Found 'Publish Data' button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            publish_data_btn.click()
-            sleep(2)
-            
-            # Step 5: Click "Back to Project" button
-            # <button type="button" class="btn btn-primary" ...>Back to Project</button>
-            back_to_project_btn = WebDriverWait(mydriver, 50).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary') and contains(., 'Back to Project')]"))
-            )
-            verbose_print("Found 'Back to Project' button", verbose)
-            wait_for_obscuring_elements(mydriver, verbose)
-            back_to_project_btn.click()
-            sleep(2)
-            
-            # Wait for navigation back to workspace
             WebDriverWait(mydriver, 30).until(
-                lambda d: '/datalumos/' in d.current_url and 'reviewPublish' not in d.current_url
+                lambda d: 'reviewPublish' in d.current_url
             )
-            verbose_print(f"Returned to workspace: {mydriver.current_url}", verbose)
-            
-            # Check for error message div
-            error_msg_divs = mydriver.find_elements(By.ID, 'errormsg')
-            if len(error_msg_divs) > 0:
-                error_msg_div = error_msg_divs[0]
-                if len(error_msg_div.text) > 0:
-                    error_text = error_msg_div.text
-                    row_info = f"Row {current_row}: " if current_row else ""
-                    error_message = f"{row_info}Error message detected: {error_text}"
-                    print(f"✗ {error_message}")
-                    raise BatchRestartException(error_message, None)
-            
-            verbose_print("✓ Publishing workflow completed successfully", verbose)
-            return True, None
-            
-        except Exception as e:
-            row_info = f"Row {current_row}: " if current_row else ""
-            error_msg = f"{row_info}Error during publishing workflow: {str(e)}"
-            verbose_print(f"⚠ {error_msg}", verbose)
-            print(f"⚠ {error_msg}")
-            print("\nFull traceback:")
-            print(traceback.format_exc())
-            
-            # If this was the first attempt, we'll retry once
-            if attempt == 0:
-                continue  # Retry once
-            else:
-                # Second attempt also failed, return error
-                return False, error_msg
+            verbose_print(f"Navigated to review/publish page: {mydriver.current_url}", verbose)
+        except TimeoutException:
+            # If timeout waiting for reviewPublish, check for error message
+            verbose_print("Timeout waiting for reviewPublish page, checking for error message...", verbose)
+            check_publish_error(mydriver, current_row)
+            # If no error message found, re-raise the timeout exception
+            raise
+        
+        # Step 2: Click "Proceed to Publish" button
+        # <button type="submit" class="btn btn-primary btn-sm" ...>Proceed to Publish</button>
+        retry_step(lambda: click_button("Proceed to Publish"))
+        
+        # Step 3: In the dialog, select options
+        retry_step(select_publish_options)
+        
+        # Step 4: Click "Publish Data" button
+        # <button type="button" class="btn btn-primary" ...>Publish Data</button>
+        retry_step(lambda: click_button("Publish Data"))
+        
+        # Step 5: Click "Back to Project" button
+        # <button type="button" class="btn btn-primary" ...>Back to Project</button>
+        retry_step(lambda: click_button("Back to Project"))
+        
+        # Wait for navigation back to workspace, and for it to finish loading
+        WebDriverWait(mydriver, 30).until(
+            lambda d: '/datalumos/' in d.current_url and 'reviewPublish' not in d.current_url
+        )
+        wait_for_obscuring_elements(mydriver, verbose)
+        verbose_print(f"Returned to workspace: {mydriver.current_url}", verbose)
+        
+        # Check for error message div
+        check_publish_error(mydriver, current_row)
+        
+        verbose_print("✓ Publishing workflow completed successfully", verbose)
+        return True, None
+        
+    except Exception as e:
+        row_info = f"Row {current_row}: " if current_row else ""
+        error_msg = f"{row_info}Error during publishing workflow: {str(e)}"
+        verbose_print(f"⚠ {error_msg}", verbose)
+        print(f"⚠ {error_msg}")
+        print("\nFull traceback:")
+        print(traceback.format_exc())
+        return False, error_msg
+
+
+# Hidden <input> fields of an HTML form (Django's CSRF token) and the attributes of a tag
+HTML_HIDDEN_INPUT_RE = re.compile(r'<input\b[^>]*\btype=["\']hidden["\'][^>]*>', re.IGNORECASE)
+HTML_ATTRIBUTE_RE = re.compile(r'([\w-]+)=(?:"([^"]*)"|\'([^\']*)\')')
+# Submit buttons of an HTML form (a browser posts the name and value of the one clicked, if it has a name)
+HTML_SUBMIT_INPUT_RE = re.compile(r'<input\b[^>]*\btype=["\']submit["\'][^>]*>', re.IGNORECASE)
+# Django's list of form errors, shown when the form is returned with validation errors, and any HTML tag
+HTML_ERRORLIST_RE = re.compile(r'<ul\b[^>]*\bclass=["\'][^"\']*\berrorlist\b[^"\']*["\'][^>]*>(.*?)</ul>',
+                               re.IGNORECASE | re.DOTALL)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def html_attributes(tag):
+    """Return the quoted attributes of an HTML tag as a dict (lower-case names, unescaped values)."""
+    return {name.lower(): html.unescape(double or single) for name, double, single in HTML_ATTRIBUTE_RE.findall(tag)}
+
+# HTTP sessions for the GWDA nomination of the current thread, with the hidden and submit fields of the
+#   form they loaded (the session keeps the CSRF cookie the token belongs to)
+gwda_sessions = threading.local()
+
+def get_gwda_form(refresh=False):
+    """
+    Return the HTTP session of the current thread and the fields a browser posts besides the inputs.
+    
+    These are the hidden fields of the nomination form (the CSRF token) and the name and value
+    of its submit button, if the button has a name. The form page is loaded only once per
+    session; its CSRF token stays valid as long as the session keeps the cookie it was issued with.
+    
+    Args:
+        refresh: Load the form page again (e.g. after the token was rejected)
     
-    # Should not reach here, but just in case
-    row_info = f"Row {current_row}: " if current_row else ""
-    return False, f"{row_info}Publishing workflow failed after retry"
+    Returns:
+        Tuple of (requests.Session, dict of field name -> value)
+    
+    Raises:
+        requests.RequestException: If the form page can't be loaded
+    """
+    if not hasattr(gwda_sessions, 'session'):
+        gwda_sessions.session = requests.Session()
+        gwda_sessions.form_fields = None
+    if refresh or gwda_sessions.form_fields is None:
+        response = gwda_sessions.session.get(GWDA_NOMINATION_URL, timeout=GWDA_TIMEOUT)
+        response.raise_for_status()
+        form_fields = {}
+        for tag in HTML_HIDDEN_INPUT_RE.findall(response.text):
+            attributes = html_attributes(tag)
+            if attributes.get('name'):
+                form_fields[attributes['name']] = attributes.get('value', '')
+        # <input type="submit" value="submit" class="btn btn-primary" ...>
+        for tag in HTML_SUBMIT_INPUT_RE.findall(response.text)[:1]:
+            attributes = html_attributes(tag)
+            if attributes.get('name'):
+                form_fields[attributes['name']] = attributes.get('value', 'Submit')
+        gwda_sessions.form_fields = form_fields
+    return gwda_sessions.session, gwda_sessions.form_fields
 
 
-def nominate_url_to_gwda(mydriver, source_url, your_name, institution, email, verbose=False):
+def nominate_url_to_gwda(source_url, your_name, institution, email, verbose=False):
     """
     Nominate a URL to the U.S. Government Web & Data Archive (GWDA).
     
+    The nomination form is posted directly over HTTP; the browser isn't involved. The
+    nomination counts as successful if the post is redirected (to the confirmation), or the
+    page returned shows no form errors.
+    
     Args:
-        mydriver: WebDriver instance
         source_url: The URL to nominate
         your_name: Name to enter in the nomination form
         institution: Institution to enter in the nomination form
@@ -1497,65 +2387,38 @@ def nominate_url_to_gwda(mydriver, source_url, your_name, institution, email, ve
     verbose_print(f"\nNominating URL to GWDA: {source_url}", verbose)
     
     try:
-        # Navigate to the nomination page
-        nomination_url = "https://digital2.library.unt.edu/nomination/GWDA-US-2025/add/"
-        verbose_print(f"Navigating to: {nomination_url}", verbose)
-        mydriver.get(nomination_url)
-        sleep(2)
-        
-        # Find and fill in the URL input field
+        # The fields of the form:
         # <input type="text" name="url_value" id="url-value" class="form-control" required="" ...>
-        url_input = WebDriverWait(mydriver, 30).until(
-            EC.presence_of_element_located((By.ID, "url-value"))
-        )
-        verbose_print("Found URL input field", verbose)
-        url_input.clear()
-        url_input.send_keys(source_url)
-        verbose_print(f"Entered URL: {source_url}", verbose)
-        sleep(0.5)
-        
-        # Find and fill in the "Your Name" field
         # <input type="text" name="nominator_name" id="your-name-value" class="form-control" ...>
-        name_input = WebDriverWait(mydriver, 30).until(
-            EC.presence_of_element_located((By.ID, "your-name-value"))
-        )
-        verbose_print("Found 'Your Name' input field", verbose)
-        name_input.clear()
-        name_input.send_keys(your_name)
-        verbose_print(f"Entered name: {your_name}", verbose)
-        sleep(0.5)
-        
-        # Find and fill in the "Institution" field
         # <input type="text" name="nominator_institution" id="institution-value" class="form-control" ...>
-        institution_input = WebDriverWait(mydriver, 30).until(
-            EC.presence_of_element_located((By.ID, "institution-value"))
-        )
-        verbose_print("Found 'Institution' input field", verbose)
-        institution_input.clear()
-        institution_input.send_keys(institution)
-        verbose_print(f"Entered institution: {institution}", verbose)
-        sleep(0.5)
-        
-        # Find and fill in the "Email" field
         # <input type="text" name="nominator_email" id="email-value" class="form-control" ...>
-        email_input = WebDriverWait(mydriver, 30).until(
-            EC.presence_of_element_located((By.ID, "email-value"))
-        )
-        verbose_print("Found 'Email' input field", verbose)
-        email_input.clear()
-        email_input.send_keys(email)
-        verbose_print(f"Entered email: {email}", verbose)
-        sleep(0.5)
-        
-        # Find and click the submit button
-        # <input type="submit" value="submit" class="btn btn-primary" ...>
-        submit_btn = WebDriverWait(mydriver, 30).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][value='submit']"))
-        )
-        verbose_print("Found submit button", verbose)
-        wait_for_obscuring_elements(mydriver, verbose)
-        submit_btn.click()
-        sleep(2)
+        fields = {
+            'url_value': source_url,
+            'nominator_name': your_name,
+            'nominator_institution': institution,
+            'nominator_email': email,
+        }
+        session, form_fields = get_gwda_form()
+        # Django checks the Referer of HTTPS form posts
+        response = session.post(GWDA_NOMINATION_URL, data={**form_fields, **fields},
+                                headers={'Referer': GWDA_NOMINATION_URL}, timeout=GWDA_TIMEOUT)
+        if response.status_code == 403:
+            # the CSRF token was rejected (e.g. the cookie expired): load the form again and repeat
+            verbose_print("CSRF token rejected, reloading the nomination form", verbose)
+            session, form_fields = get_gwda_form(refresh=True)
+            response = session.post(GWDA_NOMINATION_URL, data={**form_fields, **fields},
+                                    headers={'Referer': GWDA_NOMINATION_URL}, timeout=GWDA_TIMEOUT)
+        if not response.ok:
+            error_msg = f"Error nominating URL to GWDA: HTTP {response.status_code}"
+            verbose_print(f"⚠ {error_msg}", verbose)
+            return False, error_msg
+        # Django returns the form with status 200 when a field is rejected; a redirect means it was accepted
+        form_errors = [] if response.history else HTML_ERRORLIST_RE.findall(response.text)
+        if form_errors:
+            error_texts = [" ".join(html.unescape(HTML_TAG_RE.sub(" ", errors)).split()) for errors in form_errors]
+            error_msg = f"GWDA rejected the nomination: {'; '.join(error_texts)}"
+            verbose_print(f"⚠ {error_msg}", verbose)
+            return False, error_msg
         
         verbose_print("✓ Successfully nominated URL to GWDA", verbose)
         return True, None
@@ -1567,16 +2430,144 @@ def nominate_url_to_gwda(mydriver, source_url, your_name, institution, email, ve
         return False, error_msg
 
 
-def process_single_row(mydriver, args, current_row, batch_num, total_rows):
+def print_row_summary(batch_num, total_rows, workspace_id, source_url, row_errors, row_warnings):
+    """
+    Print the non-verbose summary of a row: one status line followed by its errors and warnings.
+    
+    The lines are collected and written with a single print call, so the summary is not
+    interleaved with other output.
+    
+    Args:
+        batch_num: Current row number in overall sequence (1-indexed)
+        total_rows: Total number of rows to process
+        workspace_id: Workspace ID of the row, or None
+        source_url: Source URL of the row, or None
+        row_errors: List of error messages for the row
+        row_warnings: List of warning messages for the row
+    
+    Example:
+        print_row_summary(3, 10, 239181, "https://data.cdc.gov/...", [], ["GWDA nomination failed: ..."])
+        # [3/10] Workspace ID: 239181 | Source URL: https://data.cdc.gov/...
+        #   ⚠ WARNING: GWDA nomination failed: ...
+    """
+    # Summary format: [batch_num/total_rows] Workspace ID: {workspace_id} | Source URL: {source_url}
+    lines = [f"[{batch_num}/{total_rows}] Workspace ID: {workspace_id if workspace_id else 'N/A'} | Source URL: {source_url if source_url else 'N/A'}"]
+    lines += [f"  ✗ ERROR: {error}" for error in row_errors]
+    lines += [f"  ⚠ WARNING: {warning}" for warning in row_warnings]
+    print("\n".join(lines))
+
+
+# Google Sheet updates run on this thread while the browser goes on with the next row
+#   (one thread, so the updates happen in order and share one Sheets API client)
+sheet_update_executor = ThreadPoolExecutor(max_workers=1)
+# Futures of submitted Google Sheet updates whose outcome hasn't been checked yet
+pending_sheet_updates = []
+# Rows waiting for the next flush_sheet_updates(): (row number, source URL, workspace ID, datadict)
+queued_sheet_rows = []
+pending_sheet_updates_lock = threading.Lock()
+
+def update_google_sheet_in_background(args, current_row, source_url, workspace_id, datadict):
+    """
+    Queue the Google Sheet update of a row, so the browser doesn't wait for the Sheets API.
+    
+    The queued rows are written together by flush_sheet_updates() at the end of the batch.
+    Failures are printed with the row number when the update has run. Missing sheet columns
+    stop the run: the error is raised by the next check_sheet_updates() call.
+    
+    Args:
+        args: Parsed command-line arguments
+        current_row: Row number (1-indexed), for messages
+        source_url: Source URL to match against the URL column
+        workspace_id: Workspace ID of the published project
+        datadict: Dictionary containing CSV row data
+    
+    Raises:
+        SheetColumnsMissingError: If an earlier update found required columns missing
+    """
+    check_sheet_updates()
+    with pending_sheet_updates_lock:
+        queued_sheet_rows.append((current_row, source_url, workspace_id, datadict))
+
+
+def flush_sheet_updates(args):
+    """
+    Write the queued Google Sheet rows in the background, with one batchUpdate call.
+    
+    Rows queued by other workers until the write starts are included in it.
+    
+    Args:
+        args: Parsed command-line arguments
+    """
+    def run_update():
+        with pending_sheet_updates_lock:
+            rows = list(queued_sheet_rows)
+            queued_sheet_rows.clear()
+        if not rows:
+            return
+        try:
+            results = update_google_sheet_rows(
+                args.google_sheet_id,
+                args.google_credentials,
+                args.google_sheet_name,
+                [(source_url, workspace_id, datadict) for _, source_url, workspace_id, datadict in rows],
+                username=args.google_username,
+                verbose=args.verbose
+            )
+            for (current_row, *_), (gsheet_success, gsheet_error) in zip(rows, results):
+                if not gsheet_success:
+                    print(f"⚠ Row {current_row}: Google Sheet update failed: {gsheet_error}")
+        except SheetColumnsMissingError:
+            # Missing required columns - stop execution
+            raise
+        except Exception as e:
+            print(f"⚠ Rows {[row[0] for row in rows]}: Error updating Google Sheet: {str(e)}")
+            print("\nFull traceback:")
+            print(traceback.format_exc())
+    
+    with pending_sheet_updates_lock:
+        if not queued_sheet_rows:
+            return
+        pending_sheet_updates.append(sheet_update_executor.submit(run_update))
+
+
+def check_sheet_updates(wait=False):
+    """
+    Collect the finished background Google Sheet updates.
+    
+    Args:
+        wait: Wait for all queued updates to finish (default: only collect finished ones)
+    
+    Raises:
+        SheetColumnsMissingError: If an update found required columns missing
+    """
+    # Take the futures to collect in one go, so two workers can't both collect (and remove) the same one
+    with pending_sheet_updates_lock:
+        futures = [future for future in pending_sheet_updates if wait or future.done()]
+        for future in futures:
+            pending_sheet_updates.remove(future)
+    error = None
+    for future in futures:
+        try:
+            future.result()
+        except SheetColumnsMissingError as e:
+            error = error or e
+    if error:
+        raise error
+
+
+def process_single_row(mydriver, args, csv_data, current_row, batch_num, total_rows, workspace_fresh=False):
     """
     Process a single row from the CSV file.
     
     Args:
         mydriver: WebDriver instance
         args: Parsed command-line arguments
+        csv_data: Header and data rows of the CSV file, as returned by load_csv_data()
         current_row: Row number to process (1-indexed)
         batch_num: Current row number in overall sequence (1-indexed)
         total_rows: Total number of rows to process
+        workspace_fresh: True if the browser shows the workspace just loaded by the sign-in
+            (default: False)
     
     Returns:
         None (errors and warnings are handled internally)
@@ -1586,9 +2577,10 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
     row_warnings = []
     workspace_id = None
     source_url = None
+    csv_updated = False
 
     try:
-        datadict = read_csv_line(args.csv_file_path, current_row)
+        datadict = read_csv_line(csv_data, current_row)
         verbose_print(f"\n{datadict}", args.verbose)
         verbose_print("\n----------------------------", args.verbose)
         
@@ -1603,8 +2595,7 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
                 error_msg = f"Row {current_row}: No workspace ID found in datalumos_id column. Cannot publish."
                 row_errors.append(error_msg)
                 if not args.verbose:
-                    print(f"[{batch_num}/{total_rows}] Workspace ID: N/A | Source URL: {source_url if source_url else 'N/A'}")
-                    print(f"  ✗ ERROR: {error_msg}")
+                    print_row_summary(batch_num, total_rows, None, source_url, row_errors, row_warnings)
                 else:
                     verbose_print(f"✗ {error_msg}", args.verbose)
                 return
@@ -1616,8 +2607,7 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
                 error_msg = f"Row {current_row}: Invalid workspace ID format: '{workspace_id_str}'. Expected a number."
                 row_errors.append(error_msg)
                 if not args.verbose:
-                    print(f"[{batch_num}/{total_rows}] Workspace ID: N/A | Source URL: {source_url if source_url else 'N/A'}")
-                    print(f"  ✗ ERROR: {error_msg}")
+                    print_row_summary(batch_num, total_rows, None, source_url, row_errors, row_warnings)
                 else:
                     verbose_print(f"✗ {error_msg}", args.verbose)
                 return
@@ -1627,12 +2617,11 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
             verbose_print(f"Navigating to workspace: {workspace_url}", args.verbose)
             mydriver.get(workspace_url)
             wait_for_obscuring_elements(mydriver, args.verbose)
-            sleep(2)
             verbose_print(f"Processing row {current_row} (only-publish mode), Workspace ID: {workspace_id}\n", args.verbose)
         else:
             # Normal mode: create project and fill forms
             verbose_print(f"Processing row {current_row}, Title: {datadict['4_title']}\n", args.verbose)
-            workspace_id = fill_project_forms(mydriver, datadict, args, row_errors, row_warnings)
+            workspace_id = fill_project_forms(mydriver, datadict, args, row_errors, row_warnings, workspace_fresh)
 
         # --- Publish Project
         
@@ -1644,38 +2633,12 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
         else:
             verbose_print("Skipping publish workflow (no-publish mode)", args.verbose)
 
-        # Update Google Sheet with publishing results (if configured)
-        if args.google_sheet_id and args.google_credentials and publish_success and workspace_id:
-            try:
-                gsheet_success, gsheet_error = update_google_sheet(
-                    args.google_sheet_id,
-                    args.google_credentials,
-                    args.google_sheet_name,
-                    source_url,
-                    workspace_id,
-                    datadict,
-                    username=args.google_username,
-                    verbose=args.verbose
-                )
-                if not gsheet_success:
-                    error_msg = f"Google Sheet update failed: {gsheet_error}"
-                    row_errors.append(error_msg)
-                    verbose_print(f"⚠ {error_msg}", args.verbose)
-            except ValueError:
-                # Missing required columns - stop execution
-                raise
-            except Exception as e:
-                error_msg = f"Error updating Google Sheet: {str(e)}"
-                verbose_print(f"⚠ {error_msg}", args.verbose)
-                print(f"⚠ {error_msg}")
-                print("\nFull traceback:")
-                print(traceback.format_exc())
-                row_errors.append(error_msg)
-
-        # Update CSV with workspace ID
+        # Update CSV with workspace ID (before the Google Sheet update, which can raise an earlier
+        #   batch's SheetColumnsMissingError: the ID of a created project must not be lost)
         if workspace_id:
+            csv_updated = True
             try:
-                update_csv_workspace_id(args.csv_file_path, current_row, workspace_id)
+                update_csv_workspace_id(args.csv_file_path, current_row, workspace_id, args.interactive)
                 verbose_print(f"✓ Updated CSV row {current_row} with workspace ID: {workspace_id}", args.verbose)
             except Exception as e:
                 error_msg = f"Failed to update CSV with workspace ID: {str(e)}"
@@ -1684,6 +2647,11 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
                 print("\nFull traceback:")
                 print(traceback.format_exc())
                 row_errors.append(error_msg)
+
+        # Update Google Sheet with publishing results (if configured)
+        if args.google_sheet_id and args.google_credentials and publish_success and workspace_id:
+            # Runs in the background while the browser goes on; failures are printed when they happen
+            update_google_sheet_in_background(args, current_row, source_url, workspace_id, datadict)
         
         # Nominate URL to GWDA (U.S. Government Web & Data Archive)
         if source_url:
@@ -1695,7 +2663,6 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
                     verbose_print("⚠ GWDA nomination skipped: No email provided", args.verbose)
                 else:
                     gwda_success, gwda_error = nominate_url_to_gwda(
-                        mydriver, 
                         source_url, 
                         args.gwda_your_name,
                         args.gwda_institution,
@@ -1715,18 +2682,7 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
         
         # Print summary line (non-verbose mode) or detailed output (verbose mode)
         if not args.verbose:
-            # Summary format: [batch_num/total_rows] Workspace ID: {workspace_id} | Source URL: {source_url}
-            workspace_display = workspace_id if workspace_id else "N/A"
-            source_url_display = source_url if source_url else "N/A"
-            print(f"[{batch_num}/{total_rows}] Workspace ID: {workspace_display} | Source URL: {source_url_display}")
-            
-            # Print errors/warnings below the summary line if any
-            if row_errors:
-                for error in row_errors:
-                    print(f"  ✗ ERROR: {error}")
-            if row_warnings:
-                for warning in row_warnings:
-                    print(f"  ⚠ WARNING: {warning}")
+            print_row_summary(batch_num, total_rows, workspace_id, source_url, row_errors, row_warnings)
         else:
             # In verbose mode, print detailed completion message
             if workspace_id:
@@ -1734,6 +2690,23 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
             else:
                 verbose_print(f"⚠ Completed processing row {current_row}, but workspace ID was not extracted.", args.verbose)
     
+    except (BatchRestartException, SheetColumnsMissingError):
+        # Not a problem of this row: restart the browser or stop the run, but keep the ID of a
+        #   project that was already created
+        if workspace_id and not csv_updated:
+            try:
+                update_csv_workspace_id(args.csv_file_path, current_row, workspace_id, args.interactive)
+            except Exception as e:
+                print(f"⚠ Row {current_row}: Failed to update CSV with workspace ID {workspace_id}: {str(e)}")
+        raise
+    except RowSkippedError as e:
+        # Nothing was done in the browser: no publish, Google Sheet update or GWDA nomination either
+        warning_msg = f"Row skipped: {str(e)}"
+        row_warnings.append(warning_msg)
+        if not args.verbose:
+            print_row_summary(batch_num, total_rows, None, source_url, row_errors, row_warnings)
+        else:
+            verbose_print(f"⚠ Row {current_row}: {warning_msg}", args.verbose)
     except Exception as e:
         error_msg = f"Error processing row {current_row}: {str(e)}"
         if args.verbose:
@@ -1744,113 +2717,152 @@ def process_single_row(mydriver, args, current_row, batch_num, total_rows):
         print(traceback.format_exc())
         row_errors.append(error_msg)
         if not args.verbose:
-            workspace_display = workspace_id if workspace_id else "N/A"
-            source_url_display = source_url if source_url else "N/A"
-            print(f"[{batch_num}/{total_rows}] Workspace ID: {workspace_display} | Source URL: {source_url_display}")
-            print(f"  ✗ ERROR: {error_msg}")
+            print_row_summary(batch_num, total_rows, workspace_id, source_url, row_errors, row_warnings)
         
         # Try to update CSV even if there was an error (if we got a workspace ID)
         if workspace_id:
             try:
-                update_csv_workspace_id(args.csv_file_path, current_row, workspace_id)
+                update_csv_workspace_id(args.csv_file_path, current_row, workspace_id, args.interactive)
             except:
                 pass  # Already logged the error above
 
 
-def main():
-    """Main execution function."""
-    # Parse command line arguments
-    args = parse_arguments()
+def take_rows(row_queue, count):
+    """
+    Take up to count row numbers from the queue, fewer if it runs empty.
     
-    # Check CSV writability before starting
-    print("\n" + "=" * 80)
-    print("Checking CSV File Writability")
-    print("=" * 80)
-    csv_writable, csv_error = check_csv_writability(args.csv_file_path)
-    if not csv_writable:
-        print(f"✗ {csv_error}")
-        print("\nPlease fix the CSV file issue before proceeding.")
-        return
-    else:
-        print(f"✓ CSV file is writable: {args.csv_file_path}\n")
+    Args:
+        row_queue: queue.Queue of row numbers
+        count: Maximum number of rows to take
     
-    # Determine which rows to process
-    if args.rows:
-        # Use specific rows from --rows parameter
-        rows_to_process = args.rows
-        total_rows = len(rows_to_process)
-    else:
-        # Use range from --start-row to --end-row
-        rows_to_process = list(range(args.start_row, args.end_row + 1))
-        total_rows = args.end_row - args.start_row + 1
+    Returns:
+        List of row numbers (empty when the queue is empty)
+    """
+    rows = []
+    while len(rows) < count:
+        try:
+            rows.append(row_queue.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+
+def quit_browser(driver):
+    """
+    Quit a browser, ignoring errors (e.g. if it has already crashed).
+    
+    Args:
+        driver: WebDriver instance, or None
+    """
+    if driver is None:
+        return
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+# Set when a worker hits an error that ends the whole run (missing Google Sheet columns);
+#   the other workers stop before their next row
+stop_run = threading.Event()
+
+def process_row_batches(args, csv_data, row_queue, row_ordinals, total_rows, label="", profile_dir=None, start_delay=0):
+    """
+    Process rows in batches (of --batch-size rows), keeping the browser and its sign-in from batch to batch.
     
-    # Split rows into batches
-    batch_size = 5
-    batches = [rows_to_process[i:i + batch_size] for i in range(0, len(rows_to_process), batch_size)]
-    total_batches = len(batches)
+    The browser is only closed and started again (with a new sign-in) after a BatchRestartException
+    or an error in a batch. The Google Sheet rows of a batch are written after the batch.
     
-    print("If you upload from USB device: MAKE SURE THE USB IS PLUGGED IN!\n")
-    print(f"Processing {total_rows} rows in {total_batches} batch(es) of up to {batch_size} rows each.\n")
+    With --workers, several of these run in parallel threads. They share one queue of rows and
+    each takes its next batch when it is ready, so a worker that gets slow rows doesn't hold up
+    the end of the run while the others sit idle. If one of them finds required Google Sheet
+    columns missing, it sets stop_run and all of them stop before their next row.
     
-    # Process each batch
-    for batch_index, batch_rows in enumerate(batches, start=1):
+    Args:
+        args: Parsed command-line arguments
+        csv_data: Header and data rows of the CSV file, as returned by load_csv_data()
+        row_queue: queue.Queue of the row numbers (1-indexed) to process
+        row_ordinals: Dictionary mapping each row number to its position in the overall sequence
+        total_rows: Total number of rows to process (over all workers)
+        label: Prefix for batch progress messages, to tell workers apart (default: none)
+        profile_dir: Browser profile directory for this worker (default: fresh profile per browser)
+        start_delay: Seconds to wait before starting the first browser (default: 0)
+    """
+    if start_delay:
+        sleep(start_delay)
+    
+    batch_size = args.batch_size
+    print(f"{label}Processing rows in batches of up to {batch_size} rows each.\n")
+    
+    # The signed-in browser, kept until a batch has to be restarted or fails
+    mydriver = None
+    # True while the browser shows the workspace as loaded by the sign-in, with no row processed on it
+    workspace_fresh = False
+    
+    # Process batches until the queue is empty
+    batch_index = 0
+    remaining_rows = []
+    while not stop_run.is_set():
+        # Rows left over from a browser restart come first, then the next rows from the queue
+        batch_rows = remaining_rows or take_rows(row_queue, batch_size)
+        if not batch_rows:
+            break
+        remaining_rows = []
+        batch_index += 1
         print(f"\n{'=' * 80}")
-        print(f"Starting Batch {batch_index}/{total_batches} (rows {batch_rows[0]}-{batch_rows[-1]})")
+        print(f"{label}Starting Batch {batch_index} (rows {batch_rows[0]}-{batch_rows[-1]}, {row_queue.qsize()} more rows queued)")
         print(f"{'=' * 80}\n")
         
-        # Initialize browser for this batch
-        mydriver = None
         try:
-            mydriver = initialize_browser(args.browser)
-            
-            # Automated sign-in
-            print("\n" + "-" * 80)
-            print("DataLumos Automated Sign-In")
-            print("-" * 80)
-            signin_success, signin_message = sign_in(mydriver, args.username, args.password)
-            if not signin_success:
-                print(f"✗ {signin_message}")
-                print("Please check the browser and complete login manually if needed.")
-                input("Press Enter to continue after manual login...")
-            else:
-                print(f"✓ {signin_message}\n")
+            if mydriver is None:
+                # Start the browser (first batch, or after a restart or an error)
+                mydriver = initialize_browser(args.browser, profile_dir, args.page_load_strategy, args.headless, args.driver_path)
+                
+                # Automated sign-in
+                print("\n" + "-" * 80)
+                print("DataLumos Automated Sign-In")
+                print("-" * 80)
+                if profile_dir and is_signed_in(mydriver):
+                    signin_success, signin_message = True, "Already signed in (saved browser profile)"
+                else:
+                    signin_success, signin_message = sign_in(mydriver, args.username, args.password, args.interactive)
+                if not signin_success:
+                    print(f"✗ {signin_message}")
+                    if not args.interactive:
+                        # Nobody can log in by hand; skip this batch rather than wait forever
+                        raise RuntimeError(f"Sign-in failed, skipping rows {batch_rows}")
+                    print("Please check the browser and complete login manually if needed.")
+                    input("Press Enter to continue after manual login...")
+                else:
+                    print(f"✓ {signin_message}\n")
+                workspace_fresh = True
             
             # Process each row in this batch
-            batch_restart_needed = False
-            remaining_rows = []
             for row_index_in_batch, current_row in enumerate(batch_rows, start=1):
-                batch_num = (batch_index - 1) * batch_size + row_index_in_batch
+                if stop_run.is_set():
+                    print(f"\n{label}Run stopped by another worker, skipping rows {batch_rows[row_index_in_batch - 1:]}")
+                    break
                 try:
-                    process_single_row(mydriver, args, current_row, batch_num, total_rows)
+                    # only the first row after the sign-in can use the workspace page as it is
+                    row_workspace_fresh, workspace_fresh = workspace_fresh, False
+                    process_single_row(mydriver, args, csv_data, current_row, row_ordinals[current_row], total_rows,
+                                       row_workspace_fresh)
                 except BatchRestartException as e:
                     # Error message already logged, close browser and restart batch with remaining rows
-                    print(f"\nBatch restart required. Closing browser...")
-                    if mydriver:
-                        try:
-                            mydriver.quit()
-                        except:
-                            pass
+                    print(f"\n{label}Batch restart required. Closing browser...")
+                    quit_browser(mydriver)
+                    mydriver = None
                     
                     # Get remaining rows from this batch (row_index_in_batch is 1-based, so slice from that index)
                     remaining_rows = batch_rows[row_index_in_batch:]
-                    batch_restart_needed = True
                     # Exit the current batch loop
                     break
-
-            # Close browser after batch is complete (if we didn't break due to BatchRestartException)
-            if not batch_restart_needed:
-                print(f"\nBatch {batch_index}/{total_batches} complete. Closing browser...")
-                if mydriver:
-                    mydriver.quit()
-                print(f"✓ Browser closed after batch {batch_index}\n")
+            
+            if remaining_rows:
+                # The remaining rows become the next batch of this worker
+                print(f"{label}Restarting batch with remaining rows: {remaining_rows}")
             else:
-                # Insert remaining rows as a new batch (using 0-based index)
-                if remaining_rows:
-                    batches.insert(batch_index, remaining_rows)
-                    total_batches = len(batches)
-                    print(f"Restarting batch with remaining rows: {remaining_rows}")
-                    # Continue outer loop to process the new batch
-                    continue
+                print(f"\n{label}Batch {batch_index} complete.\n")
         
         except BatchRestartException as e:
             # This shouldn't happen here since we catch it in the inner loop, but just in case
@@ -1858,23 +2870,98 @@ def main():
             print(f"\n✗ Batch restart exception: {error_msg}")
             print("\nFull traceback:")
             print(traceback.format_exc())
-            if mydriver:
-                try:
-                    mydriver.quit()
-                except:
-                    pass
+            quit_browser(mydriver)
+            mydriver = None
+        except SheetColumnsMissingError:
+            # Every following row would fail the same way - stop the run (in all workers)
+            stop_run.set()
+            quit_browser(mydriver)
+            raise
         except Exception as e:
             error_msg = str(e)
-            print(f"\n✗ Error during batch {batch_index}: {error_msg}")
+            print(f"\n{label}✗ Error during batch {batch_index}: {error_msg}")
             # Always print full traceback for debugging
             print("\nFull traceback:")
             print(traceback.format_exc())
-            # Close browser even if there was an error
-            if mydriver:
-                try:
-                    mydriver.quit()
-                except:
-                    pass
+            # Close browser even if there was an error; the next batch starts a new one
+            quit_browser(mydriver)
+            mydriver = None
+        finally:
+            # Write the Google Sheet rows of this batch
+            flush_sheet_updates(args)
+    
+    if mydriver is not None:
+        print(f"\n{label}All batches done. Closing browser...")
+        quit_browser(mydriver)
+        print(f"{label}✓ Browser closed\n")
+
+
+def main():
+    """Main execution function."""
+    # Parse command line arguments
+    args = parse_arguments()
+    
+    # Check CSV writability before starting
+    print("\n" + "=" * 80)
+    print("Checking CSV File Writability")
+    print("=" * 80)
+    csv_writable, csv_error = check_csv_writability(args.csv_file_path)
+    if not csv_writable:
+        print(f"✗ {csv_error}")
+        print("\nPlease fix the CSV file issue before proceeding.")
+        return
+    else:
+        print(f"✓ CSV file is writable: {args.csv_file_path}\n")
+    
+    # Read the CSV once; rows are looked up by index while processing
+    try:
+        csv_data = load_csv_data(args.csv_file_path)
+    except (OSError, csv.Error) as e:
+        print(f"✗ Could not read CSV file: {args.csv_file_path}\n   Error: {str(e)}")
+        return
+    
+    # Determine which rows to process
+    if args.rows:
+        # Use specific rows from --rows parameter
+        rows_to_process = args.rows
+        total_rows = len(rows_to_process)
+    else:
+        # Use range from --start-row to --end-row
+        rows_to_process = list(range(args.start_row, args.end_row + 1))
+        total_rows = args.end_row - args.start_row + 1
+    
+    # Number each row in processing order, for the [n/total] progress display
+    row_ordinals = {row: ordinal for ordinal, row in enumerate(rows_to_process, start=1)}
+    workers = min(args.workers, len(rows_to_process))
+    row_queue = queue.Queue()
+    for row in rows_to_process:
+        row_queue.put(row)
+    
+    # A sheet without the required columns stops the run before anything is published
+    if not check_sheet_columns(args):
+        print("\nPlease fix the Google Sheet's columns before proceeding.")
+        return
+    
+    print("If you upload from USB device: MAKE SURE THE USB IS PLUGGED IN!\n")
+    if workers <= 1:
+        process_row_batches(args, csv_data, row_queue, row_ordinals, total_rows, profile_dir=args.profile_dir)
+    else:
+        # Every worker takes its next batch from the shared queue
+        print(f"Processing {total_rows} rows with {workers} parallel workers.\n")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(process_row_batches, args, csv_data, row_queue,
+                                row_ordinals, total_rows, f"[Worker {worker + 1}] ",
+                                # a browser profile can only be used by one browser at a time
+                                os.path.join(args.profile_dir, f"worker{worker + 1}") if args.profile_dir else None,
+                                worker * WORKER_START_STAGGER)
+                for worker in range(workers)
+            ]
+            for future in futures:
+                future.result()
+    
+    # Let the last Google Sheet updates finish
+    check_sheet_updates(wait=True)
     
     # Final message after all batches
     print("\n" + "=" * 80)
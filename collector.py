@@ -9,12 +9,17 @@ import argparse
 import sys
 import requests
 from pathlib import Path
+from urllib.parse import urlparse
 from datetime import datetime
 import time
 import re
 import os
+import queue
 import shutil
+import threading
 import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
 
@@ -163,7 +168,7 @@ def sanitize_folder_name(name, max_length=100):
     return sanitized
 
 
-def create_title_folder(base_dir, title, verbose=False):
+def create_title_folder(base_dir, title, verbose=False, suffix=""):
     """
     Create or reuse a folder named after the title and return the full path.
     If the folder already exists, clears all files in it.
@@ -172,6 +177,7 @@ def create_title_folder(base_dir, title, verbose=False):
         base_dir: Base directory path
         title: Title to use for folder name
         verbose: If True, print status messages
+        suffix: Text appended to the sanitized title, e.g. to tell rows with the same title apart
     
     Returns:
         Path object for the created/cleared folder, or None if creation failed
@@ -186,7 +192,7 @@ def create_title_folder(base_dir, title, verbose=False):
         return None
     
     # Sanitize the title for folder name
-    folder_name = sanitize_folder_name(title, max_length=120)
+    folder_name = sanitize_folder_name(title, max_length=120 - len(suffix)) + suffix
     folder_path = base_path / folder_name
     
     # If folder exists, clear all files in it
@@ -753,7 +759,7 @@ def get_source_data(row, url_source_col, title_source_col, office_source_col, ag
     return url, title, office, agency
 
 
-def create_data_folder(base_data_dir, title, verbose=False):
+def create_data_folder(base_data_dir, title, verbose=False, suffix=""):
     """
     Create a data folder based on title (alias for create_title_folder for consistency).
     
@@ -761,11 +767,12 @@ def create_data_folder(base_data_dir, title, verbose=False):
         base_data_dir: Base directory for creating title folders
         title: Title to use for folder name
         verbose: If True, print status messages
+        suffix: Text appended to the folder name (default: none)
     
     Returns:
         Path object for the created folder, or None if creation failed
     """
-    return create_title_folder(base_data_dir, title, verbose=verbose)
+    return create_title_folder(base_data_dir, title, verbose=verbose, suffix=suffix)
 
 
 def create_new_output_row(url, title, office, agency, files_path_str):
@@ -800,88 +807,192 @@ def create_new_output_row(url, title, office, agency, files_path_str):
     }
 
 
-def update_output_data(output_df, new_row, output_file, verbose=False):
+# Number of new or updated rows after which the output file is saved (it is also saved at the end of the run)
+SAVE_EVERY = 10
+
+
+class OutputFile:
     """
-    Update or append a row to the output DataFrame and save to file.
-    If a row with the same URL already exists, it will be updated instead of creating a duplicate.
+    The output CSV file, held as a list of row dictionaries that rows are added to (or updated in) by URL.
     
-    Args:
-        output_df: DataFrame to update/append to
-        new_row: Dictionary representing the new row
-        output_file: Path to output Excel file
-        verbose: If True, print status messages
+    Rows are added in constant time; the file is written every SAVE_EVERY rows and by flush().
+    A lock serializes the updates, so the workers of process_rows() can share one OutputFile.
     
-    Returns:
-        Updated output_df
+    Example:
+        output = OutputFile("CDCCollectedData.csv", output_columns)
+        output.update(new_row)
+        ...
+        output.flush()
     """
-    url = new_row.get('7_original_distribution_url')
     
-    # Check if a row with the same URL already exists
-    if url and '7_original_distribution_url' in output_df.columns:
-        matching_indices = output_df[output_df['7_original_distribution_url'] == url].index
+    def __init__(self, output_file, output_columns):
+        """
+        Load the output file, or start an empty one if it doesn't exist or can't be read.
         
-        if len(matching_indices) > 0:
-            # Update the first matching row (in case there are duplicates)
-            idx = matching_indices[0]
-            # Ensure columns that may contain strings are object dtype to avoid dtype warnings
-            string_columns = ['dataset_size', 'dataset_rows', 'dataset_cols', 'file_extensions', 
-                            '12_download_date_original_source', '6_summary_description', '8_keywords', 'Status', 
-                            'path', '7_original_distribution_url', '4_title', '5_agency', '5_agency2']
-            for col in string_columns:
-                if col in output_df.columns and output_df[col].dtype != 'object':
-                    output_df[col] = output_df[col].astype('object')
-            
-            for key, value in new_row.items():
-                output_df.at[idx, key] = value
-            if verbose:
-                print(f"  Updated existing row in output file")
-        else:
-            # No matching row found, append new row
-            output_df = pd.concat([output_df, pd.DataFrame([new_row])], ignore_index=True)
+        Args:
+            output_file: Path to output CSV file
+            output_columns: List of output column names (added if missing from the file)
+        """
+        self.output_file = output_file
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.columns = list(output_columns)
+        self.rows = []
+        if Path(output_file).exists():
+            try:
+                existing_df = pd.read_csv(output_file, encoding='utf-8-sig')
+                # Keep the columns of the file, and ensure all required columns exist
+                self.columns = list(existing_df.columns) + [col for col in output_columns if col not in existing_df.columns]
+                self.rows = existing_df.to_dict('records')
+            except Exception as e:
+                print(f"Warning: Could not read existing output file, creating new one: {e}")
+        # Position of the first row of each URL, to update that row instead of adding a duplicate
+        self._row_by_url = {}
+        for index, row in enumerate(self.rows):
+            url = row.get('7_original_distribution_url')
+            if isinstance(url, str) and url:
+                self._row_by_url.setdefault(url, index)
+    
+    def update(self, new_row, verbose=False):
+        """
+        Update the row with the same URL, or append the row; save the file every SAVE_EVERY rows.
+        
+        Args:
+            new_row: Dictionary representing the new row
+            verbose: If True, print status messages
+        """
+        with self._lock:
+            url = new_row.get('7_original_distribution_url')
+            if url and url in self._row_by_url:
+                # Update the first matching row (in case there are duplicates)
+                self.rows[self._row_by_url[url]].update(new_row)
+                if verbose:
+                    print(f"  Updated existing row in output file")
+            else:
+                if url:
+                    self._row_by_url[url] = len(self.rows)
+                self.rows.append(dict(new_row))
+                if verbose:
+                    print(f"  Added new row to output file")
+            self._unsaved += 1
+            if self._unsaved >= SAVE_EVERY:
+                self._save(verbose)
+    
+    def flush(self, verbose=False):
+        """
+        Save the file, if any row was added or updated since it was last saved.
+        
+        Args:
+            verbose: If True, print status messages
+        """
+        with self._lock:
+            if self._unsaved:
+                self._save(verbose)
+    
+    def _save(self, verbose):
+        """Write all rows to the file; exit if it can't be written. Called with the lock held."""
+        try:
+            pd.DataFrame(self.rows, columns=self.columns).to_csv(self.output_file, index=False, encoding='utf-8-sig')
+            self._unsaved = 0
             if verbose:
-                print(f"  Added new row to output file")
-    else:
-        # No URL to match on, just append
-        output_df = pd.concat([output_df, pd.DataFrame([new_row])], ignore_index=True)
-        if verbose:
-            print(f"  Added new row to output file")
+                print(f"  Saved to output file")
+        except Exception as e:
+            print(f"  ERROR: Could not save output file: {e}")
+            sys.exit(1)
+
+
+# Chromium switches for the collector's browsers: skip the GPU, background services and throttling
+#   of background pages (the pages of parallel workers must keep running at full speed)
+CHROMIUM_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=TranslateUI",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+]
+
+
+def launch_browser(playwright, headless=True):
+    """
+    Launch the Chromium browser the rows of a worker are processed in.
     
-    try:
-        output_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        if verbose:
-            print(f"  Saved to output file")
-    except Exception as e:
-        print(f"  ERROR: Could not save output file: {e}")
-        sys.exit(1)
+    Args:
+        playwright: Playwright instance (from sync_playwright())
+        headless: If False, run browser in visible mode for debugging (default: True)
     
-    return output_df
+    Returns:
+        Playwright browser object
+    """
+    return playwright.chromium.launch(headless=headless, slow_mo=500 if not headless else 0, args=CHROMIUM_ARGS)
 
 
+# Analytics and ad hosts (and their subdomains) the source pages load from; never needed for the PDF or the export
+BLOCKED_HOSTS_RE = re.compile(r'(^|\.)(googletagmanager\.com|google-analytics\.com|doubleclick\.net|hotjar\.com)$')
 
+# Resource types not loaded with --minimal-pdf; stylesheets are also skipped, but only those of other sites
+MINIMAL_PDF_BLOCKED_TYPES = {'image', 'media', 'font'}
 
-def convert_source_to_pdf(url, pdf_path, timeout=120000, headless=True, verbose=False):
+
+def block_requests(context, page_url, minimal_pdf=False):
     """
-    Convert a source URL to PDF in a browser session.
+    Abort the requests of a browser context that the PDF and the export don't need.
+    
+    Requests to analytics and ad hosts are always aborted. With minimal_pdf, images, media
+    and fonts are not loaded either, nor stylesheets of other sites than the page's, so the
+    page settles much sooner (the PDF then shows no images).
+    
+    Args:
+        context: Playwright browser context
+        page_url: URL of the source page (its host is the page's own site)
+        minimal_pdf: If True, also block images, media, fonts and third-party stylesheets
+    """
+    page_host = urlparse(page_url).hostname
+    
+    def handle(route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if BLOCKED_HOSTS_RE.search(host):
+            route.abort()
+        elif minimal_pdf and (request.resource_type in MINIMAL_PDF_BLOCKED_TYPES
+                              or (request.resource_type == 'stylesheet' and host != page_host)):
+            route.abort()
+        else:
+            route.continue_()
+    
+    context.route("**/*", handle)
+
+
+def convert_source_to_pdf(browser, url, pdf_path, timeout=120000, minimal_pdf=False, verbose=False):
+    """
+    Convert a source URL to PDF in a new browser context.
     Sets rows per page, expands content, and generates PDF.
     
     Args:
+        browser: Playwright browser object (see launch_browser())
         url: URL to process
         pdf_path: Path object where PDF should be saved
         timeout: Timeout in milliseconds (default: 120 seconds)
-        headless: If False, run browser in visible mode for debugging (default: True)
+        minimal_pdf: If True, don't load images, media, fonts and third-party stylesheets
+            (see block_requests())
         verbose: If True, print status messages
     
     Returns:
-        Tuple of (page: Playwright page object, browser: Playwright browser object, 
+        Tuple of (page: Playwright page object, context: Playwright browser context,
                  pdf_status: str, total_rows: int or None)
-        Caller is responsible for closing the browser.
+        Caller is responsible for closing the context (not the browser, which is reused).
     """
-    playwright = None
-    browser = None
+    context = None
     try:
-        playwright = sync_playwright().start()
-        browser = playwright.chromium.launch(headless=headless, slow_mo=500 if not headless else 0)
-        page = browser.new_page()
+        # A fresh context per URL: no cookies or storage carried over from the previous page
+        context = browser.new_context()
+        block_requests(context, url, minimal_pdf)
+        page = context.new_page()
         
         page.goto(url, wait_until='domcontentloaded', timeout=timeout)
         page.wait_for_timeout(500)
@@ -899,12 +1010,10 @@ def convert_source_to_pdf(url, pdf_path, timeout=120000, headless=True, verbose=
         page.pdf(path=str(pdf_path), format='A4', print_background=True)
         pdf_status = "PDF generated"
         
-        return page, browser, playwright, pdf_status, total_rows
+        return page, context, pdf_status, total_rows
     except Exception as e:
-        if browser:
-            browser.close()
-        if playwright:
-            playwright.stop()
+        if context:
+            context.close()
         error_msg = f"ERROR: Could not convert source to PDF: {e}"
         if verbose:
             print(f"  {error_msg}")
@@ -912,7 +1021,8 @@ def convert_source_to_pdf(url, pdf_path, timeout=120000, headless=True, verbose=
 
 
 def process_row(row, url_source_col, title_source_col, office_source_col, agency_source_col,
-                base_data_dir, output_df, output_file, output_columns, headless=True, verbose=False, ordinal=None, total=None, spreadsheet_row=None):
+                base_data_dir, output, output_columns, browser, minimal_pdf=False, verbose=False, ordinal=None, total=None, spreadsheet_row=None,
+                folder_suffix=""):
     """
     Process a single row from the source sheet.
     
@@ -923,17 +1033,19 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
         office_source_col: Column name for office
         agency_source_col: Column name for agency
         base_data_dir: Base directory for creating title folders
-        output_df: DataFrame to append results to
-        output_file: Path to output Excel file
+        output: OutputFile the result row is written to
         output_columns: List of output column names
-        headless: If False, run browser in visible mode for debugging
+        browser: Playwright browser object the page is opened in (see launch_browser())
+        minimal_pdf: If True, make the PDF without images, media and fonts (see block_requests())
         verbose: If True, show detailed logging
         ordinal: Ordinal number (1-based) of dataset in current batch (optional)
         total: Total number of rows in batch for logging (optional)
         spreadsheet_row: Original spreadsheet row index (optional)
+        folder_suffix: Text appended to the data folder name, for rows whose titles give the
+            same folder name (default: none)
     
     Returns:
-        Updated output_df
+        The output row written for this source row
     """
     # Get source data
     url, title, office, agency = get_source_data(row, url_source_col, title_source_col, office_source_col, agency_source_col)
@@ -943,7 +1055,7 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
         print(f"  Title: {title}")
     
     # Create data folder
-    folder_path = create_data_folder(base_data_dir, title, verbose=verbose)
+    folder_path = create_data_folder(base_data_dir, title, verbose=verbose, suffix=folder_suffix)
     if not folder_path:
         if verbose:
             print(f"  ERROR: Could not create folder for title")
@@ -967,8 +1079,8 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
             else:
                 idx_str = ""
             print(f"{idx_str}{url} - Invalid URL")
-        output_df = update_output_data(output_df, new_row, output_file)
-        return output_df
+        output.update(new_row)
+        return new_row
     
     # Access URL
     if verbose:
@@ -984,8 +1096,8 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
             else:
                 idx_str = ""
             print(f"{idx_str}{url} - {status_msg}")
-        output_df = update_output_data(output_df, new_row, output_file)
-        return output_df
+        output.update(new_row)
+        return new_row
     
     if verbose:
         print(f"  ✓ Status: {status_msg}")
@@ -1002,11 +1114,10 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
         print(f"  Processing URL (PDF + Export)...")
     
     # Convert source to PDF
-    browser = None
-    playwright = None
+    context = None
     problems = []
     try:
-        page, browser, playwright, pdf_status, total_rows = convert_source_to_pdf(url, pdf_path, headless=headless, verbose=verbose)
+        page, context, pdf_status, total_rows = convert_source_to_pdf(browser, url, pdf_path, minimal_pdf=minimal_pdf, verbose=verbose)
         if verbose:
             print(f"  ✓ PDF saved: {pdf_path}")
         
@@ -1092,22 +1203,54 @@ def process_row(row, url_source_col, title_source_col, office_source_col, agency
                 idx_str = ""
             print(f"{idx_str}{url} - Error: {e}")
     finally:
-        if browser:
-            browser.close()
-        if playwright:
-            playwright.stop()
+        if context:
+            context.close()
     
     # Update output data (append row and save)
-    output_df = update_output_data(output_df, new_row, output_file, verbose=verbose)
+    output.update(new_row, verbose=verbose)
     
-    return output_df
+    return new_row
 
 
-def process_rows(source_file, output_file, start_row=0, num_rows=None, headless=True, verbose=False):
+def process_row_queue(row_queue, process, headless=True):
+    """
+    Process rows from the queue until it is empty, all in one browser.
+    
+    The browser is launched once (and again only if it has crashed); each row gets a new
+    context in it. A sync Playwright instance can only be used by the thread that started it,
+    so every worker thread runs this with its own browser.
+    
+    Args:
+        row_queue: queue.Queue of argument tuples for process
+        process: Function called as process(browser, *arguments) for each row
+        headless: If False, run browser in visible mode for debugging (default: True)
+    """
+    with sync_playwright() as playwright:
+        browser = launch_browser(playwright, headless)
+        try:
+            while True:
+                try:
+                    arguments = row_queue.get_nowait()
+                except queue.Empty:
+                    return
+                if not browser.is_connected():
+                    print("  Browser disconnected, launching a new one")
+                    browser = launch_browser(playwright, headless)
+                process(browser, *arguments)
+        finally:
+            if browser.is_connected():
+                browser.close()
+
+
+def process_rows(source_file, output_file, start_row=0, num_rows=None, headless=True, verbose=False, workers=1, minimal_pdf=False):
     """
     Process rows from source sheet and write to output sheet.
     Handles setup and cleanup, then calls process_row for each row.
     
+    Each worker launches one browser for all of its rows. With more than one worker, rows are
+    processed in parallel threads; the time is mostly spent waiting for pages and downloads,
+    not computing.
+    
     Args:
         source_file: Path to source Excel file
         output_file: Path to output Excel file
@@ -1115,6 +1258,8 @@ def process_rows(source_file, output_file, start_row=0, num_rows=None, headless=
         num_rows: Number of eligible rows to process (None = all remaining)
         headless: If False, run browser in visible mode for debugging (default: True)
         verbose: If True, show detailed logging (default: False)
+        workers: Number of rows processed at the same time (default: 1)
+        minimal_pdf: If True, make the PDFs without images, media and fonts (default: False)
     """
     # Setup: Get filtered rows
     filtered_df, url_col = get_filtered_rows(source_file)
@@ -1150,35 +1295,64 @@ def process_rows(source_file, output_file, start_row=0, num_rows=None, headless=
     base_data_dir = r'C:\Documents\DataRescue\CDC data'
     
     # Load or create output file
-    output_path = Path(output_file)
-    if output_path.exists():
-        try:
-            output_df = pd.read_csv(output_file, encoding='utf-8-sig')
-            # Ensure all required columns exist
-            for col in output_columns:
-                if col not in output_df.columns:
-                    output_df[col] = None
-        except Exception as e:
-            print(f"Warning: Could not read existing output file, creating new one: {e}")
-            output_df = pd.DataFrame(columns=output_columns)
-    else:
-        output_df = pd.DataFrame(columns=output_columns)
+    output = OutputFile(output_file, output_columns)
     
     if verbose:
         print(f"\nBase data directory: {base_data_dir}")
     if not headless:
         print("DEBUG MODE: Browser will be visible")
     
-    # Process each row
-    for ordinal, (spreadsheet_row, row) in enumerate(rows_to_process.iterrows(), start=1):
+    # Folder names that several rows' titles lead to; those rows get their row number appended, so
+    #   one row doesn't clear (or overwrite) the files of another, also not while workers run in parallel.
+    #   Compared case-insensitively, as Windows folder names are
+    folder_name_counts = Counter(
+        sanitize_folder_name(get_source_data(row, url_source_col, title_source_col, office_source_col, agency_source_col)[1],
+                             max_length=120).casefold()
+        for _, row in rows_to_process.iterrows()
+    )
+    shared_folder_names = {name for name, count in folder_name_counts.items() if count > 1}
+    
+    def run_row(browser, ordinal, spreadsheet_row, row):
         if verbose:
             print(f"\n[{ordinal}/{len(rows_to_process)} row: {spreadsheet_row}] Processing row {spreadsheet_row}...")
-        output_df = process_row(
+        title = get_source_data(row, url_source_col, title_source_col, office_source_col, agency_source_col)[1]
+        folder_suffix = f" (row {spreadsheet_row})" if sanitize_folder_name(title, max_length=120).casefold() in shared_folder_names else ""
+        process_row(
             row, url_source_col, title_source_col, office_source_col, agency_source_col,
-            base_data_dir, output_df, output_file, output_columns, headless=headless,
-            verbose=verbose, ordinal=ordinal, total=len(rows_to_process), spreadsheet_row=spreadsheet_row
+            base_data_dir, output, output_columns, browser, minimal_pdf=minimal_pdf,
+            verbose=verbose, ordinal=ordinal, total=len(rows_to_process), spreadsheet_row=spreadsheet_row,
+            folder_suffix=folder_suffix
         )
     
+    # Queue of the rows to process, taken by the workers in order
+    row_queue = queue.Queue()
+    for ordinal, (spreadsheet_row, row) in enumerate(rows_to_process.iterrows(), start=1):
+        row_queue.put((ordinal, spreadsheet_row, row))
+    
+    # Process each row
+    try:
+        if workers <= 1:
+            process_row_queue(row_queue, run_row, headless)
+        else:
+            print(f"Processing {workers} rows at a time")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(process_row_queue, row_queue, run_row, headless) for _ in range(workers)]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # A fatal error (e.g. the output file can't be saved) ends the run: drop the rows not
+                    #   started yet, the other workers stop after their current row
+                    while True:
+                        try:
+                            row_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                    raise
+    finally:
+        # Save the rows since the last save, also when the run is interrupted (e.g. Ctrl-C)
+        output.flush(verbose=verbose)
+    
     # Cleanup: Print summary
     print(f"\n{'='*80}")
     print(f"Processing complete! {len(rows_to_process)} rows processed.")
@@ -1221,10 +1395,23 @@ def main():
         default=True,
         help='Run browser in visible mode for debugging (default: headless)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of rows processed in parallel, each in its own browser (default: 1)'
+    )
+    parser.add_argument(
+        '--minimal-pdf',
+        action='store_true',
+        help="Don't load images, media, fonts and third-party stylesheets; pages load faster, "
+             "but the PDFs show no images (default: load everything)"
+    )
     
     args = parser.parse_args()
     
-    process_rows(args.input, args.output, args.start_row, args.num_rows, headless=args.headless)
+    process_rows(args.input, args.output, args.start_row, args.num_rows, headless=args.headless,
+                 workers=args.workers, minimal_pdf=args.minimal_pdf)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+"""
+Per-row values for the DataLumos upload, derived once from a CSV row.
+
+The CSV exported from the spreadsheet marks empty cells inconsistently (empty string or a
+single space). RowData normalizes that once, so the form-filling code can simply test
+`if row.summary:` instead of repeating `len(x) != 0 and x != " "` checks.
+"""
+
+# Quotes and brackets removed from keyword cells in a single pass (cells may be written as Python list literals)
+KEYWORD_STRIP_TABLE = str.maketrans('', '', "'[]\"")
+
+
+def parse_keywords(keywordcells):
+    """
+    Flatten the keyword cells of a CSV row into a single list of keywords.
+
+    Each cell holds a comma separated list, possibly written as a Python list literal;
+    quotes and brackets are removed. Keywords of two characters or less are dropped, and a
+    keyword repeated (in the same or another cell) is kept only once.
+
+    Args:
+        keywordcells: List of cell values (strings, may be empty)
+
+    Returns:
+        List of distinct keyword strings, in order of first appearance
+
+    Example:
+        parse_keywords(["['Health', 'COVID-19']", "", "vaccines, NA, Health"])
+        # -> ['Health', 'COVID-19', 'vaccines']
+    """
+    # dict.fromkeys drops repeats but keeps the order
+    return list(dict.fromkeys(
+        keyword
+        for cell in keywordcells if cell.strip()
+        for keyword in (k.strip(" '") for k in cell.translate(KEYWORD_STRIP_TABLE).split(","))
+        if len(keyword) > 2
+    ))
+
+
+def _cell(datadict, key):
+    """Return the cell value, or "" for missing, None or whitespace-only cells."""
+    value = datadict.get(key) or ""
+    return value if value.strip() else ""
+
+
+class RowData:
+    """
+    The values of one CSV row that the DataLumos project form needs, normalized once.
+
+    Empty and whitespace-only cells become "", so every field can be tested for truth.
+
+    Example:
+        row = RowData(read_csv_line(csv_data, 3))
+        if row.geographic_coverage:
+            ...
+    """
+
+    def __init__(self, datadict):
+        """
+        Args:
+            datadict: Dictionary of one CSV row (column name -> cell value)
+        """
+        title = _cell(datadict, "4_title")
+        pre_title = _cell(datadict, "4_pre_title")
+        # title with pre-title (if existent):
+        self.title = f"{pre_title} {title}" if pre_title else title
+        self.agencies = [agency for agency in (_cell(datadict, "5_agency"), _cell(datadict, "5_agency2")) if agency]
+        self.summary = _cell(datadict, "6_summary_description")
+        self.source_url = _cell(datadict, "7_original_distribution_url")
+        self.keywords = parse_keywords([
+            _cell(datadict, "8_subject_terms1"),
+            _cell(datadict, "8_subject_terms2"),
+            _cell(datadict, "8_keywords"),
+        ])
+        self.geographic_coverage = _cell(datadict, "9_geographic_coverage")
+        self.time_period_start = _cell(datadict, "10_time_period1")
+        self.time_period_end = _cell(datadict, "10_time_period2")
+        self.data_type = _cell(datadict, "11_data_types")
+        # the text for collection notes is the note and the download date (each only if present)
+        download_date = _cell(datadict, "12_download_date_original_source")
+        notes = _cell(datadict, "12_collection_notes")
+        download_note = f"(Downloaded {download_date})" if download_date else ""
+        self.collection_notes = f"{notes} {download_note}" if notes else download_note
+        self.path = _cell(datadict, "path")
+
+    @property
+    def has_time_period(self):
+        """True if a start or an end of the time period is given."""
+        return bool(self.time_period_start or self.time_period_end)
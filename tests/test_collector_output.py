@@ -0,0 +1,127 @@
+"""
+Tests for the buffered output file of collector.py (OutputFile and its flush by process_rows).
+
+Run with:  python -m unittest discover tests
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+import collector
+from collector import SAVE_EVERY, OutputFile
+
+OUTPUT_COLUMNS = ['7_original_distribution_url', '4_title', 'Status']
+
+
+def output_row(number):
+    """Return an output row for source row number."""
+    return {'7_original_distribution_url': f"https://data.cdc.gov/d/{number:04d}", '4_title': f"Dataset {number}", 'Status': "Success"}
+
+
+class OutputFileTest(unittest.TestCase):
+    """Buffering, periodic saving and updating of the output rows."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'output.csv')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_output(self):
+        return pd.read_csv(self.path, encoding='utf-8-sig')
+
+    def test_saves_on_every_tenth_row(self):
+        output = OutputFile(self.path, OUTPUT_COLUMNS)
+        for number in range(1, SAVE_EVERY):
+            output.update(output_row(number))
+        self.assertFalse(os.path.exists(self.path))
+
+        output.update(output_row(SAVE_EVERY))
+        self.assertEqual(len(self.read_output()), SAVE_EVERY)
+
+    def test_flush_writes_last_partial_batch(self):
+        output = OutputFile(self.path, OUTPUT_COLUMNS)
+        for number in range(1, SAVE_EVERY + 4):
+            output.update(output_row(number))
+        self.assertEqual(len(self.read_output()), SAVE_EVERY)
+
+        output.flush()
+        written = self.read_output()
+        self.assertEqual(list(written.columns), OUTPUT_COLUMNS)
+        self.assertEqual(list(written['4_title']), [f"Dataset {number}" for number in range(1, SAVE_EVERY + 4)])
+
+    def test_updates_row_with_same_url(self):
+        pd.DataFrame([output_row(1), output_row(2)]).to_csv(self.path, index=False, encoding='utf-8-sig')
+        output = OutputFile(self.path, OUTPUT_COLUMNS + ['path'])
+        output.update({**output_row(2), 'Status': "HTTP 404"})
+        output.update(output_row(3))
+        output.flush()
+
+        written = self.read_output()
+        self.assertEqual(list(written.columns), OUTPUT_COLUMNS + ['path'])
+        self.assertEqual(list(written['4_title']), ["Dataset 1", "Dataset 2", "Dataset 3"])
+        self.assertEqual(list(written['Status']), ["Success", "HTTP 404", "Success"])
+
+
+class ProcessRowsFlushTest(unittest.TestCase):
+    """process_rows() saves the buffered rows also when a row raises."""
+
+    FAILING_ROW = 13
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'output.csv')
+        source_df = pd.DataFrame({
+            'URL': [f"https://data.cdc.gov/d/{number:04d}" for number in range(1, 21)],
+            'Title': [f"Dataset {number}" for number in range(1, 21)],
+        })
+        self.written_titles = set()
+        self.lock = threading.Lock()
+        patches = [
+            mock.patch.object(collector, 'get_filtered_rows', return_value=(source_df, 'URL')),
+            mock.patch.object(collector, 'sync_playwright'),
+            mock.patch.object(collector, 'launch_browser'),
+            mock.patch.object(collector, 'process_row', side_effect=self.fake_process_row),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fake_process_row(self, row, url_source_col, title_source_col, office_source_col, agency_source_col,
+                         base_data_dir, output, output_columns, browser, **kwargs):
+        """Write the row, or fail on FAILING_ROW, like a row whose output can't be handled."""
+        if row['Title'] == f"Dataset {self.FAILING_ROW}":
+            raise RuntimeError("worker failed")
+        output.update({'7_original_distribution_url': row['URL'], '4_title': row['Title'], 'Status': "Success"})
+        with self.lock:
+            self.written_titles.add(row['Title'])
+
+    def assert_all_written_rows_saved(self):
+        written = pd.read_csv(self.path, encoding='utf-8-sig')
+        self.assertEqual(set(written['4_title']), self.written_titles)
+        self.assertEqual(len(written), len(self.written_titles))
+
+    def test_single_worker_saves_rows_before_failure(self):
+        with self.assertRaises(RuntimeError):
+            collector.process_rows("source.xlsx", self.path, workers=1)
+        self.assertEqual(len(self.written_titles), self.FAILING_ROW - 1)
+        self.assert_all_written_rows_saved()
+
+    def test_parallel_workers_save_rows_before_failure(self):
+        with self.assertRaises(RuntimeError):
+            collector.process_rows("source.xlsx", self.path, workers=3)
+        self.assertGreaterEqual(len(self.written_titles), 1)
+        self.assert_all_written_rows_saved()
+
+
+if __name__ == '__main__':
+    unittest.main()
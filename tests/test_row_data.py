@@ -0,0 +1,100 @@
+"""
+Tests for row_data: keyword parsing and the normalized values of a CSV row.
+
+Run with:  python -m unittest discover tests
+"""
+
+import unittest
+
+from row_data import RowData, parse_keywords
+
+
+class ParseKeywordsTest(unittest.TestCase):
+    """Splitting, stripping and de-duplicating the keyword cells."""
+
+    def test_splits_comma_separated_cells(self):
+        self.assertEqual(parse_keywords(["Health, Vaccines", "COVID-19"]), ["Health", "Vaccines", "COVID-19"])
+
+    def test_strips_quotes_and_brackets_of_list_literals(self):
+        self.assertEqual(parse_keywords(["['Health', \"COVID-19\"]"]), ["Health", "COVID-19"])
+
+    def test_drops_short_keywords(self):
+        self.assertEqual(parse_keywords(["NA, US, flu"]), ["flu"])
+
+    def test_keeps_first_of_repeated_keywords(self):
+        self.assertEqual(parse_keywords(["Health, Vaccines", "vaccines, Health"]), ["Health", "Vaccines", "vaccines"])
+
+    def test_skips_empty_and_blank_cells(self):
+        self.assertEqual(parse_keywords(["", " ", "Health"]), ["Health"])
+
+    def test_no_cells(self):
+        self.assertEqual(parse_keywords([]), [])
+
+
+class RowDataTest(unittest.TestCase):
+    """Field mapping and normalization of empty cells."""
+
+    FULL_ROW = {
+        "4_title": "Weekly Deaths",
+        "4_pre_title": "CDC",
+        "5_agency": "Centers for Disease Control and Prevention",
+        "5_agency2": "NCHS",
+        "6_summary_description": "Counts of deaths by week.",
+        "7_original_distribution_url": "https://data.cdc.gov/d/abcd-1234",
+        "8_subject_terms1": "['Health']",
+        "8_subject_terms2": "Deaths",
+        "8_keywords": "mortality, Health",
+        "9_geographic_coverage": "United States",
+        "10_time_period1": "2020-01",
+        "10_time_period2": "2024",
+        "11_data_types": "survey data",
+        "12_download_date_original_source": "2025-02-01",
+        "12_collection_notes": "Collected by DRP.",
+        "path": ".\\data\\Weekly Deaths",
+    }
+
+    def test_maps_all_fields(self):
+        row = RowData(self.FULL_ROW)
+        self.assertEqual(row.title, "CDC Weekly Deaths")
+        self.assertEqual(row.agencies, ["Centers for Disease Control and Prevention", "NCHS"])
+        self.assertEqual(row.summary, "Counts of deaths by week.")
+        self.assertEqual(row.source_url, "https://data.cdc.gov/d/abcd-1234")
+        self.assertEqual(row.keywords, ["Health", "Deaths", "mortality"])
+        self.assertEqual(row.geographic_coverage, "United States")
+        self.assertEqual(row.time_period_start, "2020-01")
+        self.assertEqual(row.time_period_end, "2024")
+        self.assertEqual(row.data_type, "survey data")
+        self.assertEqual(row.collection_notes, "Collected by DRP. (Downloaded 2025-02-01)")
+        self.assertEqual(row.path, ".\\data\\Weekly Deaths")
+        self.assertTrue(row.has_time_period)
+
+    def test_missing_cells_become_empty(self):
+        row = RowData({})
+        self.assertEqual(row.title, "")
+        self.assertEqual(row.agencies, [])
+        self.assertEqual(row.summary, "")
+        self.assertEqual(row.source_url, "")
+        self.assertEqual(row.keywords, [])
+        self.assertEqual(row.collection_notes, "")
+        self.assertFalse(row.has_time_period)
+
+    def test_blank_and_none_cells_become_empty(self):
+        row = RowData({"4_title": "Title", "4_pre_title": " ", "5_agency": None, "5_agency2": "NCHS",
+                       "6_summary_description": "  ", "10_time_period2": "2024"})
+        self.assertEqual(row.title, "Title")
+        self.assertEqual(row.agencies, ["NCHS"])
+        self.assertEqual(row.summary, "")
+        self.assertTrue(row.has_time_period)
+
+    def test_collection_notes_with_only_download_date(self):
+        row = RowData({"12_download_date_original_source": "2025-02-01"})
+        self.assertEqual(row.collection_notes, "(Downloaded 2025-02-01)")
+
+    def test_collection_notes_without_download_date(self):
+        # the separator is kept as the form text has always been entered (the editor ignores it)
+        row = RowData({"12_collection_notes": "Collected by DRP."})
+        self.assertEqual(row.collection_notes, "Collected by DRP. ")
+
+
+if __name__ == '__main__':
+    unittest.main()
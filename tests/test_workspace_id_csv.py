@@ -0,0 +1,95 @@
+"""
+Tests for workspace_id_csv: setting workspace IDs in memory and writing the CSV file back.
+
+Run with:  python -m unittest discover tests
+"""
+
+import csv
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from workspace_id_csv import WorkspaceIdCsv
+
+
+class WorkspaceIdCsvTest(unittest.TestCase):
+    """Round trip of the CSV file through WorkspaceIdCsv."""
+
+    HEADER = ['4_title', '7_original_distribution_url', 'datalumos_id', 'path']
+    ROWS = [
+        ['Weekly Deaths', 'https://data.cdc.gov/d/aaaa-1111', '', '.\\data\\Weekly Deaths'],
+        ['Vaccinations, by "state"', 'https://data.cdc.gov/d/bbbb-2222', '', '.\\data\\Vaccinations'],
+        ['Hospital Beds', 'https://data.cdc.gov/d/cccc-3333', '239000', '.\\data\\Hospital Beds'],
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'data.csv')
+        self.write_csv(self.HEADER, self.ROWS)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_csv(self, header, rows):
+        with open(self.path, 'w', encoding='utf-8-sig', newline='') as datafile:
+            writer = csv.writer(datafile)
+            writer.writerow(header)
+            writer.writerows(rows)
+
+    def read_csv(self):
+        with open(self.path, 'r', encoding='utf-8-sig', newline='') as datafile:
+            return list(csv.reader(datafile))
+
+    def test_sets_ids_and_keeps_other_cells(self):
+        id_csv = WorkspaceIdCsv(self.path)
+        id_csv.set(1, 239181)
+        id_csv.set(2, 239182)
+        id_csv.flush()
+
+        header, *rows = self.read_csv()
+        self.assertEqual(header, self.HEADER)
+        self.assertEqual(rows, [
+            ['Weekly Deaths', 'https://data.cdc.gov/d/aaaa-1111', '239181', '.\\data\\Weekly Deaths'],
+            ['Vaccinations, by "state"', 'https://data.cdc.gov/d/bbbb-2222', '239182', '.\\data\\Vaccinations'],
+            self.ROWS[2],
+        ])
+
+    def test_adds_missing_id_column(self):
+        self.write_csv(['4_title'], [['Weekly Deaths'], ['Hospital Beds']])
+        id_csv = WorkspaceIdCsv(self.path)
+        id_csv.set(2, 239183)
+        id_csv.flush()
+
+        self.assertEqual(self.read_csv(), [['4_title', 'datalumos_id'], ['Weekly Deaths'], ['Hospital Beds', '239183']])
+
+    def test_flush_without_changes_leaves_file_alone(self):
+        before = os.stat(self.path).st_mtime_ns
+        WorkspaceIdCsv(self.path).flush()
+        self.assertEqual(os.stat(self.path).st_mtime_ns, before)
+
+    def test_failed_write_keeps_original_file_and_changes(self):
+        id_csv = WorkspaceIdCsv(self.path)
+        id_csv.set(1, 239181)
+        with mock.patch('workspace_id_csv.os.replace', side_effect=PermissionError("file is open in Excel")):
+            with self.assertRaises(PermissionError):
+                id_csv.flush()
+
+        self.assertEqual(self.read_csv(), [self.HEADER] + self.ROWS)
+        self.assertEqual(os.listdir(self.directory.name), ['data.csv'])
+        # the change is still pending and written by the next flush
+        id_csv.flush()
+        self.assertEqual(self.read_csv()[1][2], '239181')
+
+    @unittest.skipIf(os.name == 'nt', "file modes are not POSIX permissions on Windows")
+    def test_keeps_file_permissions(self):
+        os.chmod(self.path, 0o644)
+        id_csv = WorkspaceIdCsv(self.path)
+        id_csv.set(1, 239181)
+        id_csv.flush()
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+In-memory copy of the CSV file for writing workspace IDs back into it.
+
+The upload script stores the DataLumos workspace ID of every processed row in the
+datalumos_id column. Reading and parsing the whole CSV again for each row made every
+update cost as much as the file is long, so the file is read once and only written back.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+
+
+class WorkspaceIdCsv:
+    """
+    The CSV file held in memory; workspace IDs are set on the copy and written back with flush().
+
+    Cells are kept as the text read from the file, so every other column is written back
+    exactly as it was. The file is read only once, so changes made to it by other programs
+    while the script runs are overwritten by the next flush().
+
+    Example:
+        id_csv = WorkspaceIdCsv("data.csv")
+        id_csv.set(3, 239181)
+        id_csv.flush()
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Path to the CSV file (UTF-8-sig encoded)
+        """
+        self.path = path
+        with open(path, "r", encoding='utf-8-sig', newline='') as datafile:
+            reader = csv.reader(datafile)
+            self.header = next(reader, [])
+            self.rows = list(reader)
+        if 'datalumos_id' not in self.header:
+            self.header.append('datalumos_id')
+        self._id_column = self.header.index('datalumos_id')
+        self._dirty = False
+
+    def set(self, row_number, workspace_id):
+        """
+        Set the workspace ID of a row in memory.
+
+        Args:
+            row_number: Row number (1-indexed, excluding header)
+            workspace_id: Workspace ID to write
+        """
+        while len(self.rows) < row_number:
+            self.rows.append([''] * len(self.header))
+        row = self.rows[row_number - 1]
+        if len(row) <= self._id_column:
+            row.extend([''] * (self._id_column + 1 - len(row)))
+        row[self._id_column] = str(workspace_id)
+        self._dirty = True
+
+    def flush(self):
+        """
+        Write the CSV file, if anything was set since the last flush.
+
+        The content is written to a temporary file next to the CSV, which then replaces it,
+        so a crash or a full disk can't leave a truncated CSV file behind. The temporary file
+        gets the permissions of the CSV file first (mkstemp creates it readable only by its owner).
+
+        Raises:
+            OSError: If the file can't be written (e.g. it is open in Excel); the
+                changes are kept and written by the next flush()
+        """
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(suffix='.csv', dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding='utf-8-sig', newline='') as datafile:
+                writer = csv.writer(datafile)
+                writer.writerow(self.header)
+                writer.writerows(self.rows)
+            if os.path.exists(self.path):
+                shutil.copymode(self.path, temp_path)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self._dirty = False